@@ -9,6 +9,11 @@ from typing import Any
 from .definition_loader import load_definition_catalog
 from .normalization import normalize_status, normalize_text, normalize_type_key
 
+try:  # Optional accelerator; stdlib json parses the same documents.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_ROBOTS_CONFIG_PATH = PROJECT_ROOT / "config" / "robots.config.json"
 DEFAULT_ROBOT_TYPES_CONFIG_PATH = PROJECT_ROOT / "config" / "robot-types.config.json"
@@ -19,7 +24,30 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_MODEL_QUALITY_BASE_PATH = "assets/models"
 
 
+# Parsed config lists keyed by (path, mtime_ns, size). Router edits rewrite
+# the file, which changes the fingerprint, so a hit always reflects what is
+# on disk; repeated loads of an unchanged file skip the parse entirely.
+_CONFIG_CACHE: dict[tuple[str, int, int], list[dict[str, Any]]] = {}
+
+
+def _config_cache_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _store_config_cache(key: tuple[str, int, int], payload: list[dict[str, Any]]) -> None:
+    stale = [existing for existing in _CONFIG_CACHE if existing[0] == key[0] and existing != key]
+    for existing in stale:
+        _CONFIG_CACHE.pop(existing, None)
+    _CONFIG_CACHE[key] = payload
+
+
 def load_json_file(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     payload = path.read_text(encoding="utf-8")
     return json.loads(payload)
 
@@ -53,8 +81,12 @@ def _normalize_legacy_model_url(
 
 
 def load_robots_config(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
+    cache_key = _config_cache_key(path)
+    if cache_key is None:
         return []
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     payload = load_json_file(path)
     robots: list[dict[str, Any]] = []
@@ -84,21 +116,27 @@ def load_robots_config(path: Path) -> list[dict[str, Any]]:
             "Robot '%s' uses deprecated modelUrl; normalizing to model.file_name/path_to_quality_folders.",
             robot_id,
         )
-    if robots:
-        return robots
-    return []
+    _store_config_cache(cache_key, robots)
+    return robots
 
 
 def load_robot_types_config(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
+    cache_key = _config_cache_key(path)
+    if cache_key is None:
         return []
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     payload = load_json_file(path)
     if isinstance(payload, list):
-        return payload
-    if isinstance(payload, dict) and isinstance(payload.get("robotTypes"), list):
-        return payload["robotTypes"]
-    return []
+        robot_types = payload
+    elif isinstance(payload, dict) and isinstance(payload.get("robotTypes"), list):
+        robot_types = payload["robotTypes"]
+    else:
+        robot_types = []
+    _store_config_cache(cache_key, robot_types)
+    return robot_types
 
 
 def _normalize_model_path(raw_path: Any, fallback: str = DEFAULT_MODEL_QUALITY_BASE_PATH) -> str:
@@ -6,6 +6,14 @@ from .read import ReadConnector
 from .write import WriteConnector
 
 
+_DRY_RUN_CHECK_TEMPLATE = {
+    "status": "warning",
+    "value": "pending",
+    "details": "Dry-run mode: execution skipped.",
+    "ms": 0,
+}
+
+
 class OrchestrateConnector:
     def __init__(self, *, read: ReadConnector, write: WriteConnector):
         self._read = read
@@ -31,10 +39,14 @@ class OrchestrateConnector:
         emit_event: Callable[[str, str, dict[str, Any] | None], None] | None = None,
         command_cache: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        execute_steps = definition.get("execute") if isinstance(definition.get("execute"), list) else []
-        checks = definition.get("checks") if isinstance(definition.get("checks"), list) else []
+        raw_execute = definition.get("execute")
+        execute_steps = raw_execute if isinstance(raw_execute, list) else []
+        raw_checks = definition.get("checks")
+        checks = raw_checks if isinstance(raw_checks, list) else []
 
         vars_payload: dict[str, Any] = dict(params or {})
+        # Resolve the callback guard once instead of per step/check.
+        emit = emit_event if callable(emit_event) else None
         steps: list[dict[str, Any]] = []
         commands_executed: list[dict[str, Any]] = []
         check_results: dict[str, dict[str, Any]] = {}
@@ -47,12 +59,7 @@ class OrchestrateConnector:
                 check_id = str(check.get("id") or "").strip()
                 if not check_id:
                     continue
-                check_results[check_id] = {
-                    "status": "warning",
-                    "value": "pending",
-                    "details": "Dry-run mode: execution skipped.",
-                    "ms": 0,
-                }
+                check_results[check_id] = _DRY_RUN_CHECK_TEMPLATE.copy()
             return {
                 "steps": steps,
                 "commandsExecuted": commands_executed,
@@ -60,13 +67,66 @@ class OrchestrateConnector:
                 "vars": vars_payload,
             }
 
+        normalized_steps: list[dict[str, Any]] = []
         for index, raw_step in enumerate(execute_steps):
             if not isinstance(raw_step, dict):
                 continue
             step = dict(raw_step)
             if "id" not in step:
                 step["id"] = f"step-{index + 1}"
+            normalized_steps.append(step)
+
+        # Multi-step definitions pay one SSH prompt round-trip per step; when
+        # every step is statically safe to combine, run them as one sentinel-
+        # framed invocation instead. Ineligible batches fall back to the
+        # per-step loop below before anything is sent.
+        batched = None
+        if len(normalized_steps) > 1:
+            try:
+                batched = self._write.try_execute_batch(
+                    steps=normalized_steps,
+                    vars_payload=vars_payload,
+                    run_scope=run_scope,
+                    command_cache=cache,
+                    run_command=run_command,
+                )
+            except Exception as exc:
+                error_step = {
+                    "id": str(normalized_steps[0].get("id") or "step-1"),
+                    "status": "error",
+                    "value": "command_error",
+                    "details": str(exc),
+                    "ms": 0,
+                    "output": "",
+                }
+                steps.append(error_step)
+                if emit is not None:
+                    emit(
+                        "step_failed",
+                        f"Step '{error_step['id']}' failed: {exc}",
+                        {"step": error_step},
+                    )
+                raise
+        if batched is not None:
+            normalized_steps = []
+            for result in batched:
+                raw_step_record = result.get("step")
+                step_record = raw_step_record if isinstance(raw_step_record, dict) else {}
+                raw_cmd_record = result.get("command")
+                cmd_record = raw_cmd_record if isinstance(raw_cmd_record, dict) else {}
+                steps.append(step_record)
+                commands_executed.append(cmd_record)
+                if emit is not None:
+                    emit(
+                        "step_executed",
+                        f"Executed step '{step_record.get('id')}'.",
+                        {
+                            "step": step_record,
+                            "command": cmd_record,
+                        },
+                    )
 
+        for step in normalized_steps:
             try:
                 result = self._write.execute_step(
                     step=step,
@@ -75,12 +135,14 @@ class OrchestrateConnector:
                     command_cache=cache,
                     run_command=run_command,
                 )
-                step_record = result.get("step") if isinstance(result.get("step"), dict) else {}
-                cmd_record = result.get("command") if isinstance(result.get("command"), dict) else {}
+                raw_step_record = result.get("step")
+                step_record = raw_step_record if isinstance(raw_step_record, dict) else {}
+                raw_cmd_record = result.get("command")
+                cmd_record = raw_cmd_record if isinstance(raw_cmd_record, dict) else {}
                 steps.append(step_record)
                 commands_executed.append(cmd_record)
-                if callable(emit_event):
-                    emit_event(
+                if emit is not None:
+                    emit(
                         "step_executed",
                         f"Executed step '{step_record.get('id', step.get('id'))}'.",
                         {
@@ -90,7 +152,7 @@ class OrchestrateConnector:
                     )
             except Exception as exc:
                 error_step = {
-                    "id": str(step.get("id") or f"step-{index + 1}"),
+                    "id": str(step.get("id") or "step"),
                     "status": "error",
                     "value": "command_error",
                     "details": str(exc),
@@ -98,8 +160,8 @@ class OrchestrateConnector:
                     "output": "",
                 }
                 steps.append(error_step)
-                if callable(emit_event):
-                    emit_event(
+                if emit is not None:
+                    emit(
                         "step_failed",
                         f"Step '{error_step['id']}' failed: {exc}",
                         {"step": error_step},
@@ -112,7 +174,8 @@ class OrchestrateConnector:
             check_id = str(raw_check.get("id") or "").strip()
             if not check_id:
                 continue
-            read_spec = raw_check.get("read") if isinstance(raw_check.get("read"), dict) else {}
+            raw_read_spec = raw_check.get("read")
+            read_spec = raw_read_spec if isinstance(raw_read_spec, dict) else {}
 
             evaluation = self._read.evaluate(read_spec, vars_payload)
             passed = bool(evaluation.get("passed"))
@@ -127,8 +190,8 @@ class OrchestrateConnector:
                 "ms": 0,
                 "read": evaluation,
             }
-            if callable(emit_event):
-                emit_event(
+            if emit is not None:
+                emit(
                     "check_evaluated",
                     f"Check '{check_id}' {'passed' if passed else 'failed'}.",
                     {
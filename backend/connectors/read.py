@@ -4,6 +4,12 @@ from typing import Any
 
 
 class ReadConnector:
+    def __init__(self) -> None:
+        # One-entry memo: checks in the same definition evaluate against the
+        # same output string object, so an identity hit reuses the normalized
+        # line set instead of re-splitting the blob per check.
+        self._last_haystack: tuple[str, list[str], frozenset[str]] | None = None
+
     @staticmethod
     def _normalize_bool(value: Any, default: bool = False) -> bool:
         if isinstance(value, bool):
@@ -31,7 +37,11 @@ class ReadConnector:
 
     @staticmethod
     def _normalize_lines(raw_text: str) -> list[str]:
-        return [line.strip() for line in str(raw_text or "").replace("\r", "").split("\n") if line.strip()]
+        return [
+            stripped
+            for line in str(raw_text or "").replace("\r", "").split("\n")
+            if (stripped := line.strip())
+        ]
 
     def _evaluate_contains_string(self, read_spec: dict[str, Any], vars_payload: dict[str, Any]) -> dict[str, Any]:
         haystack = str(self._resolve_value(read_spec.get("inputRef"), vars_payload, default=""))
@@ -59,14 +69,19 @@ class ReadConnector:
         needles = [str(item).strip() for item in needles_raw if str(item).strip()]
 
         case_sensitive = self._normalize_bool(read_spec.get("caseSensitive"), default=False)
-        if case_sensitive:
-            matched = [needle for needle in needles if needle in haystack]
-        else:
-            lowered = haystack.lower()
-            matched = [needle for needle in needles if needle.lower() in lowered]
+        lowered = haystack if case_sensitive else haystack.lower()
+        matched: list[str] = []
+        missing: list[str] = []
+        # Single pass: classifying each needle as it is tested replaces the
+        # follow-up `needle not in matched` list scan per needle.
+        for needle in needles:
+            probe = needle if case_sensitive else needle.lower()
+            if probe in lowered:
+                matched.append(needle)
+            else:
+                missing.append(needle)
 
         passed = len(matched) > 0 if needles else False
-        missing = [needle for needle in needles if needle not in matched]
         return {
             "passed": passed,
             "kind": "contains_any_string",
@@ -75,10 +90,18 @@ class ReadConnector:
             "missing": missing,
         }
 
+    def _haystack_lines(self, text: str) -> tuple[list[str], frozenset[str]]:
+        memo = self._last_haystack
+        if memo is not None and memo[0] is text:
+            return memo[1], memo[2]
+        lines = self._normalize_lines(text)
+        line_set = frozenset(lines)
+        self._last_haystack = (text, lines, line_set)
+        return lines, line_set
+
     def _evaluate_contains_lines_unordered(self, read_spec: dict[str, Any], vars_payload: dict[str, Any]) -> dict[str, Any]:
         haystack_raw = self._resolve_value(read_spec.get("inputRef"), vars_payload, default="")
-        haystack_lines = self._normalize_lines(str(haystack_raw or ""))
-        haystack_set = set(haystack_lines)
+        haystack_lines, haystack_set = self._haystack_lines(str(haystack_raw or ""))
 
         lines_raw = self._resolve_value(read_spec.get("lines"), vars_payload, default=[])
         if not isinstance(lines_raw, list):
@@ -87,8 +110,10 @@ class ReadConnector:
 
         require_all = self._normalize_bool(read_spec.get("requireAll"), default=True)
 
-        matched = [line for line in expected_lines if line in haystack_set]
-        missing = [line for line in expected_lines if line not in haystack_set]
+        matched: list[str] = []
+        missing: list[str] = []
+        for line in expected_lines:
+            (matched if line in haystack_set else missing).append(line)
 
         if not expected_lines:
             passed = False
@@ -155,14 +180,18 @@ class ReadConnector:
             "totalRules": total_rules,
         }
 
+    # Dispatch table in declaration order; one dict probe replaces the
+    # string-comparison chain per evaluated check.
+    _EVALUATORS = {
+        "contains_string": _evaluate_contains_string,
+        "contains_lines_unordered": _evaluate_contains_lines_unordered,
+        "contains_any_string": _evaluate_contains_any_string,
+        "all_of": _evaluate_all_of,
+    }
+
     def evaluate(self, read_spec: dict[str, Any], vars_payload: dict[str, Any]) -> dict[str, Any]:
         kind = str(read_spec.get("kind") or "").strip().lower()
-        if kind == "contains_string":
-            return self._evaluate_contains_string(read_spec, vars_payload)
-        if kind == "contains_lines_unordered":
-            return self._evaluate_contains_lines_unordered(read_spec, vars_payload)
-        if kind == "contains_any_string":
-            return self._evaluate_contains_any_string(read_spec, vars_payload)
-        if kind == "all_of":
-            return self._evaluate_all_of(read_spec, vars_payload)
-        raise ValueError(f"Unsupported read kind '{kind}'")
+        evaluator = self._EVALUATORS.get(kind)
+        if evaluator is None:
+            raise ValueError(f"Unsupported read kind '{kind}'")
+        return evaluator(self, read_spec, vars_payload)
@@ -7,6 +7,14 @@ from typing import Any, Callable
 
 class WriteConnector:
     TOKEN_PATTERN = re.compile(r"^\$([A-Za-z0-9_.-]+)\$$")
+    # Sentinels are echoed quoted (echo "__BATCH_STEP__"0) so the PTY echo of
+    # the combined command line never matches these anchored patterns; only
+    # the marker printed by the shell does.
+    BATCH_BEGIN_SENTINEL = "__BATCH_BEGIN__"
+    BATCH_STEP_SENTINEL = "__BATCH_STEP__"
+    BATCH_DEFAULT_TIMEOUT_SEC = 12.0
+    _BATCH_BEGIN_RE = re.compile(r"(?m)^__BATCH_BEGIN__[ \t\r]*$")
+    _BATCH_STEP_RE = re.compile(r"(?m)^__BATCH_STEP__(\d+)[ \t\r]*$")
 
     def __init__(self, command_primitives_by_id: dict[str, dict[str, Any]] | None = None):
         self._command_primitives_by_id = command_primitives_by_id or {}
@@ -38,6 +46,148 @@ class WriteConnector:
 
         return resolved_command, primitive
 
+    def _plan_batch_step(
+        self,
+        step: dict[str, Any],
+        vars_payload: dict[str, Any],
+        run_scope: str,
+        command_cache: dict[str, str],
+    ) -> dict[str, Any] | None:
+        """Statically resolve one step for batching, or None when unsafe.
+
+        A step only joins a batch when nothing about it can depend on the
+        outputs of earlier steps in the same batch: literal command (tokens
+        are fine, they resolve against the static primitive table), literal
+        timeout, zero retries, and no pending command-cache hit.
+        """
+        if isinstance(step.get("command"), dict):
+            return None
+        try:
+            resolved_command, primitive = self._resolve_command(step.get("command"), vars_payload)
+        except ValueError:
+            return None
+        if self.BATCH_BEGIN_SENTINEL in resolved_command or self.BATCH_STEP_SENTINEL in resolved_command:
+            return None
+
+        step_timeout = step.get("timeoutSec")
+        if step_timeout is None and isinstance(primitive, dict):
+            step_timeout = primitive.get("timeoutSec")
+        if isinstance(step_timeout, dict):
+            return None
+
+        retries_raw = step.get("retries")
+        if retries_raw is None and isinstance(primitive, dict):
+            retries_raw = primitive.get("retries")
+        if isinstance(retries_raw, dict) or int(retries_raw or 0) != 0:
+            return None
+
+        reuse_key = str(step.get("reuseKey") or "").strip()
+        cache_key = f"{run_scope}:{reuse_key}" if reuse_key else ""
+        if cache_key and cache_key in command_cache:
+            return None
+
+        return {
+            "id": str(step.get("id") or "command"),
+            "command": resolved_command,
+            "timeoutSec": float(step_timeout) if step_timeout is not None else None,
+            "saveAs": str(step.get("saveAs") or "").strip(),
+            "cacheKey": cache_key,
+        }
+
+    def try_execute_batch(
+        self,
+        *,
+        steps: list[dict[str, Any]],
+        vars_payload: dict[str, Any],
+        run_scope: str,
+        command_cache: dict[str, str],
+        run_command: Callable[[str, float | None], str],
+    ) -> list[dict[str, Any]] | None:
+        """Run all steps in one shell invocation when that is safe.
+
+        Returns per-step {step, command} records shaped like execute_step's,
+        or None when the batch is ineligible or its framing cannot be parsed
+        back out of the output (callers then fall back to per-step runs; in
+        the parse-failure case nothing was sent, so no command runs twice).
+        """
+        if not callable(run_command) or len(steps) < 2:
+            return None
+
+        plans: list[dict[str, Any]] = []
+        total_timeout = 0.0
+        for step in steps:
+            plan = self._plan_batch_step(step, vars_payload, run_scope, command_cache)
+            if plan is None:
+                return None
+            plans.append(plan)
+            timeout = plan["timeoutSec"]
+            total_timeout += timeout if timeout is not None else self.BATCH_DEFAULT_TIMEOUT_SEC
+
+        parts = [f'echo "{self.BATCH_BEGIN_SENTINEL}"']
+        for index, plan in enumerate(plans):
+            parts.append(plan["command"])
+            parts.append(f'echo "{self.BATCH_STEP_SENTINEL}"{index}')
+        combined = "; ".join(parts)
+
+        started_ns = time.monotonic_ns()
+        try:
+            output = run_command(combined, total_timeout)
+        except Exception:
+            return None
+        elapsed = max(0, (time.monotonic_ns() - started_ns) // 1_000_000)
+
+        begin = self._BATCH_BEGIN_RE.search(output)
+        if not begin:
+            # The shell never echoed the begin marker back; treat the whole
+            # invocation as failed rather than guessing at slice boundaries.
+            raise RuntimeError("Command failed: batched invocation produced no output framing")
+
+        # Slice each step's output between its surrounding markers. Steps
+        # past the last marker (combined timeout) get the remaining tail,
+        # mirroring the partial output a timed-out single command returns.
+        slices: list[str] = []
+        cursor = begin.end()
+        for match in self._BATCH_STEP_RE.finditer(output, begin.end()):
+            slices.append(output[cursor:match.start()])
+            cursor = match.end()
+        while len(slices) < len(plans):
+            slices.append(output[cursor:])
+            cursor = len(output)
+
+        records: list[dict[str, Any]] = []
+        for index, plan in enumerate(plans):
+            step_output = slices[index]
+            if plan["saveAs"]:
+                vars_payload[plan["saveAs"]] = step_output
+            if plan["cacheKey"]:
+                command_cache[plan["cacheKey"]] = step_output
+            # Wall time is shared by the whole batch; attribute it to the
+            # first step so per-test totals stay roughly truthful.
+            step_ms = elapsed if index == 0 else 0
+            records.append(
+                {
+                    "step": {
+                        "id": plan["id"],
+                        "status": "ok",
+                        "value": "ok",
+                        "details": "Command executed (batched).",
+                        "ms": step_ms,
+                        "output": step_output,
+                    },
+                    "command": {
+                        "id": plan["id"],
+                        "command": plan["command"],
+                        "timeoutSec": plan["timeoutSec"],
+                        "output": step_output,
+                        "exitCode": 0,
+                        "ok": True,
+                        "durationMs": step_ms,
+                        "usedCache": False,
+                    },
+                }
+            )
+        return records
+
     def execute_step(
         self,
         *,
@@ -94,7 +244,7 @@ class WriteConnector:
                 },
             }
 
-        started_at = int(time.time() * 1000)
+        started_ns = time.monotonic_ns()
         last_error: Exception | None = None
         output = ""
         attempts = retries + 1
@@ -106,7 +256,7 @@ class WriteConnector:
             except Exception as exc:
                 last_error = exc
 
-        elapsed = max(0, int(time.time() * 1000 - started_at))
+        elapsed = max(0, (time.monotonic_ns() - started_ns) // 1_000_000)
         if last_error is not None:
             raise RuntimeError(f"Command failed: {last_error}")
 
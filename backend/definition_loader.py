@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import marshal
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,10 +10,17 @@ from typing import Any
 
 from .normalization import normalize_status, normalize_text
 
+try:  # Optional accelerator; stdlib json parses the same documents.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 
 TOKEN_PATTERN = re.compile(r"^\$([A-Za-z0-9_.-]+)\$$")
 BASE_READ_KINDS = {"contains_string", "contains_lines_unordered", "contains_any_string"}
 VALID_READ_KINDS = set(BASE_READ_KINDS) | {"all_of"}
+CATALOG_CACHE_FILENAME = ".definition-catalog.cache"
+_CATALOG_CACHE_VERSION = 1
 
 
 @dataclass
@@ -23,7 +32,10 @@ class DefinitionCatalog:
 
 
 def _load_json_object(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        payload = orjson.loads(path.read_bytes())
+    else:
+        payload = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
         raise ValueError(f"Definition file '{path}' must contain a JSON object")
     return payload
@@ -191,7 +203,7 @@ def _normalize_test(raw: dict[str, Any]) -> dict[str, Any]:
                 normalized_step[key] = raw_step.get(key)
         normalized_execute.append(normalized_step)
 
-    return {
+    normalized: dict[str, Any] = {
         "id": definition_id,
         "label": normalize_text(raw.get("label"), definition_id),
         "enabled": bool(raw.get("enabled", True)),
@@ -200,6 +212,9 @@ def _normalize_test(raw: dict[str, Any]) -> dict[str, Any]:
         "checks": normalized_checks,
         "params": raw.get("params") if isinstance(raw.get("params"), dict) else {},
     }
+    if raw.get("cacheTtlSec") is not None:
+        normalized["cacheTtlSec"] = raw.get("cacheTtlSec")
+    return normalized
 
 
 def _normalize_fix(raw: dict[str, Any]) -> dict[str, Any]:
@@ -267,12 +282,91 @@ def _validate_command_refs(
         _validate_steps("Fix definition", fix_id, definition.get("execute") or [])
 
 
+def _definition_source_snapshot(
+    command_primitives_dir: Path,
+    tests_dir: Path,
+    fixes_dir: Path,
+) -> tuple[tuple[str, int, int], ...]:
+    """Fingerprint every definition file as (path, mtime_ns, size)."""
+    entries: list[tuple[str, int, int]] = []
+    for directory, suffix in (
+        (command_primitives_dir, ".command.json"),
+        (tests_dir, ".test.json"),
+        (fixes_dir, ".fix.json"),
+    ):
+        if not directory.exists():
+            continue
+        for file_path in sorted(directory.glob(f"*{suffix}")):
+            stat = file_path.stat()
+            entries.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def _load_catalog_cache(
+    cache_path: Path,
+    snapshot: tuple[tuple[str, int, int], ...],
+) -> DefinitionCatalog | None:
+    try:
+        with cache_path.open("rb") as handle:
+            payload = marshal.load(handle)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if not isinstance(payload, tuple) or len(payload) != 3:
+        return None
+    version, cached_snapshot, catalogs = payload
+    if version != _CATALOG_CACHE_VERSION or cached_snapshot != snapshot:
+        return None
+    if not isinstance(catalogs, tuple) or len(catalogs) != 4:
+        return None
+    return DefinitionCatalog(
+        command_primitives_by_id=catalogs[0],
+        test_definitions_by_id=catalogs[1],
+        check_definitions_by_id=catalogs[2],
+        fix_definitions_by_id=catalogs[3],
+    )
+
+
+def _store_catalog_cache(
+    cache_path: Path,
+    snapshot: tuple[tuple[str, int, int], ...],
+    catalog: DefinitionCatalog,
+) -> None:
+    payload = (
+        _CATALOG_CACHE_VERSION,
+        snapshot,
+        (
+            catalog.command_primitives_by_id,
+            catalog.test_definitions_by_id,
+            catalog.check_definitions_by_id,
+            catalog.fix_definitions_by_id,
+        ),
+    )
+    try:
+        tmp_path = cache_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as handle:
+            marshal.dump(payload, handle)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        # Cache is purely an optimization; a read-only config dir or an
+        # unmarshalable payload must never break startup.
+        pass
+
+
 def load_definition_catalog(
     *,
     command_primitives_dir: Path,
     tests_dir: Path,
     fixes_dir: Path,
 ) -> DefinitionCatalog:
+    # Normalizing and validating every definition JSON dominates cold start
+    # for large catalogs, so the result is persisted next to the config and
+    # reused verbatim while the (path, mtime_ns, size) fingerprints match.
+    snapshot = _definition_source_snapshot(command_primitives_dir, tests_dir, fixes_dir)
+    cache_path = tests_dir.parent / CATALOG_CACHE_FILENAME
+    cached = _load_catalog_cache(cache_path, snapshot)
+    if cached is not None:
+        return cached
+
     primitive_entries = _load_definition_dir(command_primitives_dir, ".command.json")
     test_entries = _load_definition_dir(tests_dir, ".test.json")
     fix_entries = _load_definition_dir(fixes_dir, ".fix.json")
@@ -313,9 +407,11 @@ def load_definition_catalog(
         fix_definitions_by_id=fix_definitions_by_id,
     )
 
-    return DefinitionCatalog(
+    catalog = DefinitionCatalog(
         command_primitives_by_id=command_primitives_by_id,
         test_definitions_by_id=test_definitions_by_id,
         check_definitions_by_id=check_definitions_by_id,
         fix_definitions_by_id=fix_definitions_by_id,
     )
+    _store_catalog_cache(cache_path, snapshot, catalog)
+    return catalog
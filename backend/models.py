@@ -5,13 +5,13 @@ from dataclasses import dataclass
 from .ssh_client import InteractiveShell
 
 
-@dataclass
+@dataclass(slots=True)
 class ShellHandle:
     shell: InteractiveShell
     last_used: float
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     id: str
     status: str
@@ -9,6 +9,18 @@ def normalize_text(value: Any, fallback: str = "") -> str:
     return str(candidate).strip() or fallback
 
 
+def normalize_str_fast(value: Any, fallback: str = "") -> str:
+    """normalize_text with a fast path for values that are already str.
+
+    Config-sourced identifiers are plain strings in practice; skipping the
+    str() conversion keeps hot loops cheap while odd inputs still fall back
+    to the full normalization.
+    """
+    if type(value) is str:
+        return value.strip() or fallback
+    return normalize_text(value, fallback)
+
+
 def normalize_status(value: Any) -> str:
     if value in ("ok", "warning", "error"):
         return value
@@ -39,5 +51,20 @@ def to_bool(value: Any) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "on", "y"}
 
 
+_EMPTY_DICT: dict[str, Any] = {}
+
+
+def dict_or_empty(value: Any) -> dict[str, Any]:
+    """Return `value` when it is a plain dict, else a shared empty dict.
+
+    Callers must treat the result as read-only. `type() is dict` skips the
+    isinstance machinery; config payloads are never dict subclasses.
+    """
+    return value if type(value) is dict else _EMPTY_DICT
+
+
+_ANSI_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
+
 def strip_ansi(text: str) -> str:
-    return re.sub(r"\x1B\[[0-?]*[ -/]*[@-~]", "", text)
+    return _ANSI_RE.sub("", text)
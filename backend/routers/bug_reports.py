@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import itertools
+import os
+import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -8,28 +12,34 @@ from fastapi import APIRouter, HTTPException
 from ..normalization import normalize_text
 from ..schemas import BugReportRequest, BugReportResponse
 
+_BUG_INDEX_RE = re.compile(r"^bug_(\d+)_")
+
 
 def create_bug_reports_router(logs_dir: Path) -> APIRouter:
     router = APIRouter()
 
-    def _bug_file_count(path: Path) -> int:
-        return sum(1 for child in path.iterdir() if child.is_file())
+    # Indices come from an in-memory counter seeded once from the highest
+    # existing report, so each POST allocates its number in O(1) instead of
+    # re-listing the directory, and concurrent POSTs cannot race to the same
+    # index.
+    counter_lock = threading.Lock()
+    counter: itertools.count | None = None
 
-    def _next_bug_report_path(path: Path) -> Path:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
-        count = _bug_file_count(path)
-        base_name = f"bug_{count}_{timestamp}"
-        candidate = path / base_name
-        if not candidate.exists():
-            return candidate
-
-        # Extremely unlikely guard for same-name collisions.
-        suffix = 1
-        while True:
-            fallback = path / f"{base_name}_{suffix}"
-            if not fallback.exists():
-                return fallback
-            suffix += 1
+    def _seed_counter() -> itertools.count:
+        start = 0
+        if logs_dir.exists():
+            for child in logs_dir.iterdir():
+                match = _BUG_INDEX_RE.match(child.name)
+                if match:
+                    start = max(start, int(match.group(1)) + 1)
+        return itertools.count(start)
+
+    def _next_bug_index() -> int:
+        nonlocal counter
+        with counter_lock:
+            if counter is None:
+                counter = _seed_counter()
+            return next(counter)
 
     @router.post("/api/bug-reports", response_model=BugReportResponse)
     def create_bug_report(body: BugReportRequest) -> BugReportResponse:
@@ -38,12 +48,25 @@ def create_bug_reports_router(logs_dir: Path) -> APIRouter:
             raise HTTPException(status_code=400, detail="Bug report message cannot be empty")
 
         logs_dir.mkdir(parents=True, exist_ok=True)
-        file_path = _next_bug_report_path(logs_dir)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
         payload = (
             f"createdAtUtc: {datetime.now(timezone.utc).isoformat()}\n"
             f"message:\n{message}\n"
-        )
-        file_path.write_text(payload, encoding="utf-8")
+        ).encode("utf-8")
+        # O_EXCL makes name allocation atomic on disk too: a file dropped in
+        # by hand just advances the counter to the next free index. The raw
+        # fd write skips the buffered text-wrapper allocation per report.
+        while True:
+            file_path = logs_dir / f"bug_{_next_bug_index()}_{timestamp}"
+            try:
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                continue
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            break
 
         return BugReportResponse(
             ok=True,
@@ -47,6 +47,7 @@ class InteractiveShell:
     """
 
     READ_BLOCK_TIMEOUT_SEC = 0.2
+    KEEPALIVE_INTERVAL_SEC = 15
 
     def __init__(
         self,
@@ -80,6 +81,9 @@ class InteractiveShell:
 
         self.client: Optional[ShellClient] = None
         self.chan: Optional[ShellChannel] = None
+        # Channels spawned off another shell share its client; only the
+        # owning shell may close the underlying transport.
+        self._owns_client = True
 
         self._out_queue: Queue[str] = Queue()
         self._reader_thread: Optional[threading.Thread] = None
@@ -95,6 +99,7 @@ class InteractiveShell:
 
     def connect(self) -> None:
         self.client = self._client_factory()
+        self._owns_client = True
         self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self.client.connect(
             hostname=self.host,
@@ -106,6 +111,8 @@ class InteractiveShell:
             look_for_keys=False,
         )
 
+        self._tune_transport()
+
         self.chan = self.client.invoke_shell(
             term=self.term,
             width=self.width,
@@ -120,6 +127,87 @@ class InteractiveShell:
         # Give it a moment to print banner/prompt.
         self._sleep(0.2)
 
+    def _tune_transport(self) -> None:
+        """Disable Nagle and enable SSH keepalives on the live transport.
+
+        Commands here are tiny writes followed by small reads; Nagle plus
+        delayed ACK can stall each round-trip by tens to hundreds of ms.
+        Keepalives additionally let dead transports surface through
+        is_alive() instead of lingering half-open. Fake clients without a
+        transport are left alone.
+        """
+        transport_getter = getattr(self.client, "get_transport", None)
+        if not callable(transport_getter):
+            return
+        transport = transport_getter()
+        if transport is None:
+            return
+        try:
+            transport.set_keepalive(self.KEEPALIVE_INTERVAL_SEC)
+            sock = getattr(transport, "sock", None)
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception:
+            pass
+
+    def spawn_channel(self) -> "InteractiveShell":
+        """Open another PTY channel over this shell's authenticated transport.
+
+        SSH multiplexes many channels per connection, so a sibling shell
+        skips the TCP + key-exchange + auth handshake entirely. The sibling
+        does not own the client: closing it closes only its channel, while
+        closing this (owning) shell tears the transport down for everyone.
+        """
+        if not self.client:
+            raise RuntimeError("Not connected")
+
+        sibling = InteractiveShell(
+            host=self.host,
+            username=self.username,
+            password=self.password,
+            port=self.port,
+            connect_timeout=self.connect_timeout,
+            term=self.term,
+            width=self.width,
+            height=self.height,
+            prompt_regex=self.prompt_re.pattern,
+            client_factory=self._client_factory,
+            sleep_fn=self._sleep,
+            time_fn=self._time,
+            prompt_detector=self._prompt_detector,
+        )
+        sibling.client = self.client
+        sibling._owns_client = False
+        sibling.chan = self.client.invoke_shell(
+            term=self.term,
+            width=self.width,
+            height=self.height,
+        )
+        sibling.chan.settimeout(self.READ_BLOCK_TIMEOUT_SEC)
+        sibling._stop.clear()
+        sibling._reader_thread = threading.Thread(target=sibling._reader_loop, daemon=True)
+        sibling._reader_thread.start()
+        sibling._sleep(0.2)
+        return sibling
+
+    def is_alive(self) -> bool:
+        """Best-effort liveness check without a remote round-trip.
+
+        A pooled shell can die between uses (robot reboot, network drop);
+        checking the channel and transport state is enough to decide whether
+        a handle is worth reusing, and costs no RTT.
+        """
+        if not self.chan or not self.client:
+            return False
+        if getattr(self.chan, "closed", False):
+            return False
+        transport_getter = getattr(self.client, "get_transport", None)
+        if callable(transport_getter):
+            transport = transport_getter()
+            if transport is None or not transport.is_active():
+                return False
+        return True
+
     def close(self) -> None:
         self._stop.set()
         if self.chan:
@@ -129,10 +217,11 @@ class InteractiveShell:
                 pass
             self.chan = None
         if self.client:
-            try:
-                self.client.close()
-            except Exception:
-                pass
+            if self._owns_client:
+                try:
+                    self.client.close()
+                except Exception:
+                    pass
             self.client = None
 
     def resize_pty(self, width: int, height: int) -> None:
@@ -41,7 +41,7 @@ class ActivityGuardMixin:
                 return True
             if robot_id in self._active_fix_runs:
                 return True
-            return any(active_robot_id == robot_id for active_robot_id, _session in self._active_test_runs)
+            return self._active_test_runs_by_robot.get(robot_id, 0) > 0
 
     def is_robot_busy(self, robot_id: str) -> bool:
         normalized_robot_id = normalize_text(robot_id, "")
@@ -58,7 +58,7 @@ class ActivityGuardMixin:
                 return False
             if normalized_robot_id in self._active_fix_runs:
                 return False
-            if any(active_robot_id == normalized_robot_id for active_robot_id, _session in self._active_test_runs):
+            if self._active_test_runs_by_robot.get(normalized_robot_id, 0) > 0:
                 return False
             self._active_search_runs.add(normalized_robot_id)
         self._mark_manual_activity(robot_id=normalized_robot_id, source="manual-search")
@@ -96,6 +96,9 @@ class ActivityGuardMixin:
             if key in self._active_test_runs:
                 return False
             self._active_test_runs.add(key)
+            self._active_test_runs_by_robot[normalized_robot_id] = (
+                self._active_test_runs_by_robot.get(normalized_robot_id, 0) + 1
+            )
             self._manual_activity_by_robot[normalized_robot_id] = time.time()
             return True
 
@@ -105,4 +108,12 @@ class ActivityGuardMixin:
         if not normalized_robot_id or not normalized_page_session_id:
             return
         with self._lock:
-            self._active_test_runs.discard((normalized_robot_id, normalized_page_session_id))
+            key = (normalized_robot_id, normalized_page_session_id)
+            if key not in self._active_test_runs:
+                return
+            self._active_test_runs.discard(key)
+            remaining = self._active_test_runs_by_robot.get(normalized_robot_id, 0) - 1
+            if remaining > 0:
+                self._active_test_runs_by_robot[normalized_robot_id] = remaining
+            else:
+                self._active_test_runs_by_robot.pop(normalized_robot_id, None)
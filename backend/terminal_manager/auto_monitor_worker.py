@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import re
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..normalization import normalize_status
+from fastapi import HTTPException
+
+from ..normalization import normalize_status, normalize_text
 
 
 class AutoMonitorWorkerMixin:
+    # Splits the fused battery+topics probe output. The probe echoes the
+    # marker quoted, so the PTY's echo of the command line never matches the
+    # anchored pattern - only the real marker line emitted between the two
+    # sections does.
+    FUSED_PROBE_MARKER = "__MONITOR_PROBE_SPLIT__"
+    _FUSED_PROBE_MARKER_RE = re.compile(r"(?m)^__MONITOR_PROBE_SPLIT__[ \t\r]*$")
+
     def _shutdown_auto_monitor_executor(self) -> None:
         executor = getattr(self, "_auto_monitor_executor", None)
         self._auto_monitor_executor = None
@@ -134,20 +144,89 @@ class AutoMonitorWorkerMixin:
                 self._last_auto_monitor_online_state[robot_id] = False
             return
 
-        if now >= next_battery:
-            self._refresh_battery_state(robot_id)
+        battery_due = now >= next_battery
+        topics_due = self._topics_monitor_enabled() and now >= next_topics
+        if battery_due and topics_due and self._refresh_battery_and_topics_state(robot_id):
             with self._lock:
                 self._battery_next_check_at[robot_id] = now + battery_interval_sec
-
-        if self._topics_monitor_enabled() and now >= next_topics:
-            self._refresh_topics_state(robot_id)
-            with self._lock:
                 self._topics_next_check_at[robot_id] = now + topics_interval_sec
+        else:
+            if battery_due:
+                self._refresh_battery_state(robot_id)
+                with self._lock:
+                    self._battery_next_check_at[robot_id] = now + battery_interval_sec
+            if topics_due:
+                self._refresh_topics_state(robot_id)
+                with self._lock:
+                    self._topics_next_check_at[robot_id] = now + topics_interval_sec
 
         latest_online = bool(self.get_runtime_probe_state(robot_id).get("isOnline"))
         with self._lock:
             self._last_auto_monitor_online_state[robot_id] = latest_online
 
+    def _refresh_battery_and_topics_state(self, robot_id: str) -> bool:
+        """Run the battery and topics probes as one framed shell round-trip.
+
+        Both probes land on the same pooled auto-monitor session anyway, so
+        when they fall due in the same tick the commands are chained with a
+        marker echo between them and the output is split on the marker -
+        one terminal round-trip instead of two. Returns True when both
+        probes were handled; False tells the caller to fall back to the
+        individual refreshers.
+        """
+        topic_tests = self._topic_tests_for_robot(robot_id)
+        if not topic_tests:
+            return False
+        claim_token = object()
+        if self._topics_refresh_inflight.setdefault(robot_id, claim_token) is not claim_token:
+            return False
+        try:
+            battery_command = self._battery_command_for_robot(robot_id)
+            now = time.time()
+            setup_due = now >= self._topics_setup_expiry.get(robot_id, 0.0)
+            topics_command = self.AUTO_MONITOR_TOPICS_COMMAND
+            timeout_sec = float(self.AUTO_MONITOR_BATTERY_TIMEOUT_SEC) + float(self.AUTO_MONITOR_TOPICS_TIMEOUT_SEC)
+            if setup_due:
+                topics_command = f"{self.AUTO_MONITOR_TOPICS_SETUP_COMMAND}; {topics_command}"
+                timeout_sec += 3.0
+            command = f'{battery_command}; echo "{self.FUSED_PROBE_MARKER}"; {topics_command}'
+
+            started_ns = time.monotonic_ns()
+            try:
+                output = self.run_command(
+                    page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID,
+                    robot_id=robot_id,
+                    command=command,
+                    timeout_sec=timeout_sec,
+                )
+            except HTTPException as exc:
+                self._topics_setup_expiry.pop(robot_id, None)
+                self._record_battery_failure(robot_id, normalize_text(exc.detail, "Unable to read /battery topic."))
+                self._record_topics_failure(
+                    robot_id,
+                    topic_tests,
+                    normalize_text(exc.detail, "Unable to run topic snapshot."),
+                )
+                return True
+            elapsed_ms = max(0, (time.monotonic_ns() - started_ns) // 1_000_000)
+
+            match = self._FUSED_PROBE_MARKER_RE.search(output)
+            if match is None:
+                # Framing lost (battery probe timed out mid-chain, prompt
+                # quirks). Both probes are read-only, so re-running them
+                # individually is safe and keeps the parsing exact.
+                self._refresh_battery_state(robot_id)
+                self._refresh_topics_state_impl(robot_id)
+                return True
+
+            if setup_due:
+                self._topics_setup_expiry[robot_id] = now + self.AUTO_MONITOR_TOPICS_SETUP_TTL_SEC
+            self._record_battery_output(robot_id, output[: match.start()], elapsed_ms)
+            self._record_topics_output(robot_id, topic_tests, output[match.end():], elapsed_ms)
+            return True
+        finally:
+            self._topics_refresh_inflight.pop(robot_id, None)
+
     def _run_auto_monitor_tick(self) -> None:
         now = time.time()
         robot_ids = list(self.robots_by_id.keys())
@@ -5,7 +5,7 @@ from typing import Any
 
 from fastapi import HTTPException
 
-from ..normalization import normalize_text, strip_ansi
+from ..normalization import dict_or_empty, normalize_text, strip_ansi
 
 
 class BatteryParserMixin:
@@ -38,11 +38,10 @@ class BatteryParserMixin:
 
     def _battery_command_for_robot(self, robot_id: str) -> str:
         robot_type = self._resolve_robot_type(robot_id)
-        auto_monitor = robot_type.get("autoMonitor") if isinstance(robot_type, dict) else {}
-        if isinstance(auto_monitor, dict):
-            configured = normalize_text(auto_monitor.get("batteryCommand"), "")
-            if configured:
-                return configured
+        auto_monitor = dict_or_empty(robot_type.get("autoMonitor"))
+        configured = normalize_text(auto_monitor.get("batteryCommand"), "")
+        if configured:
+            return configured
         return self.AUTO_MONITOR_BATTERY_COMMAND
 
     def _parse_battery_output(self, raw_output: str, elapsed_ms: int) -> dict[str, Any]:
@@ -67,18 +66,10 @@ class BatteryParserMixin:
                     "source": "auto-monitor",
                 }
 
-        fields: dict[str, str] = {}
-        for raw_line in cleaned.split("\n"):
-            line = normalize_text(raw_line, "")
-            if not line:
-                continue
-            match = self.BATTERY_FIELD_PATTERN.match(line)
-            if not match:
-                continue
-            key = normalize_text(match.group(1), "").lower()
-            value = normalize_text(match.group(2), "")
-            if key and value:
-                fields[key] = value
+        # Single regex pass over the payload; the multiline pattern handles
+        # surrounding whitespace, and later duplicate keys overwrite earlier
+        # ones just like the old per-line loop did.
+        fields = {match.group(1).lower(): match.group(2) for match in self.BATTERY_FIELD_PATTERN.finditer(cleaned)}
 
         percentage_raw = None
         for key in ("percentage", "percent", "soc", "state_of_charge", "battery_percent"):
@@ -159,34 +150,22 @@ class BatteryParserMixin:
             "source": "auto-monitor",
         }
 
-    def _refresh_battery_state(self, robot_id: str) -> None:
-        started_ms = int(time.time() * 1000)
-        battery_command = self._battery_command_for_robot(robot_id)
-        try:
-            output = self.run_command(
-                page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID,
-                robot_id=robot_id,
-                command=battery_command,
-                timeout_sec=self.AUTO_MONITOR_BATTERY_TIMEOUT_SEC,
-            )
-        except HTTPException as exc:
-            detail = normalize_text(exc.detail, "Unable to read /battery topic.")
-            self.close_session(page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID, robot_id=robot_id)
-            self.apply_online_probe_to_runtime(
-                robot_id=robot_id,
-                probe={
-                    "status": "error",
-                    "value": "unreachable",
-                    "details": detail,
-                    "ms": 0,
-                    "checkedAt": time.time(),
-                    "source": "auto-monitor",
-                },
-                source="auto-monitor",
-            )
-            return
+    def _record_battery_failure(self, robot_id: str, detail: str) -> None:
+        self.close_session(page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID, robot_id=robot_id)
+        self.apply_online_probe_to_runtime(
+            robot_id=robot_id,
+            probe={
+                "status": "error",
+                "value": "unreachable",
+                "details": normalize_text(detail, "Unable to read /battery topic."),
+                "ms": 0,
+                "checkedAt": time.time(),
+                "source": "auto-monitor",
+            },
+            source="auto-monitor",
+        )
 
-        elapsed_ms = max(0, int(time.time() * 1000 - started_ms))
+    def _record_battery_output(self, robot_id: str, output: str, elapsed_ms: int) -> None:
         battery = self._parse_battery_output(output, elapsed_ms)
         self._record_runtime_tests(
             robot_id,
@@ -202,3 +181,20 @@ class BatteryParserMixin:
                 "battery": battery,
             },
         )
+
+    def _refresh_battery_state(self, robot_id: str) -> None:
+        started_ms = int(time.time() * 1000)
+        battery_command = self._battery_command_for_robot(robot_id)
+        try:
+            output = self.run_command(
+                page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID,
+                robot_id=robot_id,
+                command=battery_command,
+                timeout_sec=self.AUTO_MONITOR_BATTERY_TIMEOUT_SEC,
+            )
+        except HTTPException as exc:
+            self._record_battery_failure(robot_id, normalize_text(exc.detail, "Unable to read /battery topic."))
+            return
+
+        elapsed_ms = max(0, int(time.time() * 1000 - started_ms))
+        self._record_battery_output(robot_id, output, elapsed_ms)
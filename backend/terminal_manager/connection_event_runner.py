@@ -113,15 +113,10 @@ class ConnectionEventRunnerMixin:
 
     def _select_connection_test_ids(self, robot_id: str) -> list[str]:
         robot_type = self._resolve_robot_type(robot_id)
-        test_entries = robot_type.get("tests") if isinstance(robot_type, dict) else []
-        if not isinstance(test_entries, list):
-            return []
 
         test_ids: list[str] = []
         seen: set[str] = set()
-        for entry in test_entries:
-            if not isinstance(entry, dict):
-                continue
+        for entry in robot_type.get("tests") or []:
             test_id = normalize_text(entry.get("id"), "")
             if not test_id or test_id in seen:
                 continue
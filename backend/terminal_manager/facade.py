@@ -56,6 +56,7 @@ class TerminalManager(
         "source ~/ws/devel/setup.bash >/dev/null 2>&1 || true"
     )
     AUTO_MONITOR_TOPICS_COMMAND = "timeout 12s rostopic list"
+    AUTO_MONITOR_TOPICS_SETUP_TTL_SEC = 30.0
     AUTO_MONITOR_PAGE_SESSION_ID = "__auto-monitor__"
     AUTO_MONITOR_BATTERY_COMMAND = (
         "source /opt/ros/noetic/setup.bash >/dev/null 2>&1 || true; "
@@ -100,7 +101,9 @@ class TerminalManager(
     BATTERY_VOLTAGE_EMPTY = 10.8
     BATTERY_VOLTAGE_FULL = 12.6
     FLOAT_PATTERN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
-    BATTERY_FIELD_PATTERN = re.compile(r"^([A-Za-z_][\w./-]*)\s*:\s*(.+)$")
+    # Multiline: one finditer pass over the whole payload replaces a Python
+    # split-strip-match loop per output line.
+    BATTERY_FIELD_PATTERN = re.compile(r"(?m)^[ \t]*([A-Za-z_][\w./-]*)[ \t]*:[ \t]*(\S[^\n]*?)[ \t]*$")
 
     def __init__(
         self,
@@ -116,6 +119,7 @@ class TerminalManager(
     ):
         self.robots_by_id = robots_by_id
         self.robot_types_by_id = robot_types_by_id
+        self._canonicalize_robot_types_in_place(self.robot_types_by_id)
         self.idle_timeout_sec = idle_timeout_sec
         self._handles = {}
         self._online_cache = {}
@@ -123,6 +127,7 @@ class TerminalManager(
         self._runtime_activity = {}
         self._runtime_version = 0
         self._runtime_robot_versions = {}
+        self._runtime_tests_snapshot_cache = {}
         self._monitor_mode = self.MONITOR_MODE_ONLINE_BATTERY
         self._topics_interval_sec = self.TOPICS_INTERVAL_DEFAULT_SEC
         self._online_interval_sec = self.ONLINE_INTERVAL_DEFAULT_SEC
@@ -134,15 +139,24 @@ class TerminalManager(
         self._manual_activity_by_robot = {}
         self._manual_defer_until_by_robot = {}
         self._active_test_runs = set()
+        # robot_id -> live test-run count, so busy checks stay O(1) instead
+        # of scanning the (robot, session) pairs per monitor tick.
+        self._active_test_runs_by_robot: dict[str, int] = {}
         self._active_search_runs = set()
         self._active_fix_runs = set()
         self._last_auto_monitor_online_state = {}
-        self._auto_recovery_test_inflight = set()
+        # robot_id -> claim token; written/cleared with single atomic dict ops.
+        self._auto_recovery_test_inflight: dict[str, object] = {}
         self._connection_retry_sessions: dict[str, dict[str, Any]] = {}
         self._connection_retry_inflight: dict[str, int] = {}
         self._connection_retry_attempt_owner: dict[str, int] = {}
         self._fix_runs: dict[tuple[str, str], dict[str, Any]] = {}
         self._next_idle_sweep_at = 0.0
+        self._definitions_version = 0
+        self._topic_tests_cache = {}
+        self._topics_setup_expiry: dict[str, float] = {}
+        # robot_id -> claim token; written/cleared with single atomic dict ops.
+        self._topics_refresh_inflight: dict[str, object] = {}
         self._auto_monitor_executor = None
         self._auto_monitor_executor_workers = 0
         self._command_primitives_by_id = command_primitives_by_id or {}
@@ -163,9 +177,7 @@ class TerminalManager(
         self._executor = TestExecutor(
             robot_types_by_id=robot_types_by_id,
             resolve_robot_type=self._resolve_robot_type,
-            resolve_credentials=self._resolve_credentials,
             get_or_connect=self.get_or_connect,
-            close_session=self.close_session,
             check_online=self.check_online,
             test_definitions_by_id=self._test_definitions_by_id,
             check_definitions_by_id=self._check_definitions_by_id,
@@ -174,6 +186,28 @@ class TerminalManager(
         if self._auto_monitor_enabled:
             self._start_auto_monitor()
 
+    @staticmethod
+    def _canonicalize_robot_type(robot_type: Any) -> dict[str, Any]:
+        """Validate a robot-type payload once at registration time.
+
+        Guarantees `tests` is a list of dicts so hot per-tick loops can
+        iterate entries without repeating isinstance guards.
+        """
+        canonical = robot_type if isinstance(robot_type, dict) else {}
+        raw_tests = canonical.get("tests")
+        if isinstance(raw_tests, list):
+            canonical["tests"] = [entry for entry in raw_tests if isinstance(entry, dict)]
+        else:
+            canonical["tests"] = []
+        return canonical
+
+    @classmethod
+    def _canonicalize_robot_types_in_place(cls, robot_types_by_id: dict[str, dict[str, Any]]) -> None:
+        # Mutate the shared mapping rather than rebinding it: routers hold a
+        # reference to the same dict.
+        for type_key in list(robot_types_by_id):
+            robot_types_by_id[type_key] = cls._canonicalize_robot_type(robot_types_by_id[type_key])
+
     def _resolve_robot_type(self, robot_id: str) -> dict[str, Any]:
         robot = self.robots_by_id.get(robot_id)
         if not robot:
@@ -206,6 +240,9 @@ class TerminalManager(
 
             self.robot_types_by_id.clear()
             self.robot_types_by_id.update(robot_types_by_id or {})
+            self._canonicalize_robot_types_in_place(self.robot_types_by_id)
+            self._definitions_version += 1
+            self._topic_tests_cache.clear()
 
             self._command_primitives_by_id = dict(command_primitives_by_id or {})
             self._test_definitions_by_id = dict(test_definitions_by_id or {})
@@ -220,9 +257,7 @@ class TerminalManager(
             self._executor = TestExecutor(
                 robot_types_by_id=self.robot_types_by_id,
                 resolve_robot_type=self._resolve_robot_type,
-                resolve_credentials=self._resolve_credentials,
                 get_or_connect=self.get_or_connect,
-                close_session=self.close_session,
                 check_online=self.check_online,
                 test_definitions_by_id=self._test_definitions_by_id,
                 check_definitions_by_id=self._check_definitions_by_id,
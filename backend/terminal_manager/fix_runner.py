@@ -210,7 +210,11 @@ class FixRunnerMixin:
             post_test_ids = params.get("postTestIds") if isinstance(params.get("postTestIds"), list) else None
             if post_test_ids is None:
                 post_test_ids = fix_spec.get("postTestIds") if isinstance(fix_spec.get("postTestIds"), list) else []
-            post_test_ids = [normalize_text(test_id, "") for test_id in post_test_ids if normalize_text(test_id, "")]
+            post_test_ids = [
+                normalized
+                for test_id in post_test_ids
+                if (normalized := normalize_text(test_id, ""))
+            ]
 
             if post_test_ids:
                 emit_event("post_tests_started", "Running post-fix tests.", {"testIds": post_test_ids})
@@ -31,6 +31,29 @@ class OnlineCheckerMixin:
 
         start_ms = int(now * 1000)
         host, username, password, port = self._resolve_credentials(robot_id)
+
+        # A live pooled auto-monitor session already proves the robot is
+        # reachable and authenticated; checking its transport costs nothing,
+        # while a fresh probe pays the full TCP + key-exchange + auth
+        # handshake every interval. Dead transports fall through to the
+        # real probe below.
+        with self._lock:
+            pooled = self._handles.get((self.AUTO_MONITOR_PAGE_SESSION_ID, robot_id))
+        if pooled is not None:
+            checker = getattr(pooled.shell, "is_alive", None)
+            if callable(checker) and checker():
+                result = {
+                    "status": "ok",
+                    "value": "reachable",
+                    "details": f"Existing SSH session alive on {host}:{port}.",
+                    "ms": max(0, int(time.time() * 1000 - start_ms)),
+                    "checkedAt": time.time(),
+                    "source": "live",
+                }
+                with self._lock:
+                    self._online_cache[robot_id] = dict(result)
+                return result
+
         from . import InteractiveShell
 
         shell = InteractiveShell(
@@ -29,20 +29,16 @@ class RuntimeStateMixin:
             return 0.0
 
     def _should_apply_runtime_update(self, previous: dict[str, Any], incoming: dict[str, Any]) -> bool:
-        previous_checked_at = self._checked_at_value(previous)
-        incoming_checked_at = self._checked_at_value(incoming)
-        if incoming_checked_at > previous_checked_at:
-            return True
-        if incoming_checked_at < previous_checked_at:
-            return False
-
-        previous_rank = self._runtime_source_rank(normalize_text(previous.get("source"), ""))
-        incoming_rank = self._runtime_source_rank(normalize_text(incoming.get("source"), ""))
-        if incoming_rank > previous_rank:
-            return True
-        if incoming_rank < previous_rank:
-            return False
-        return True
+        # Newer checkedAt wins; ties fall to source rank, and an equal rank
+        # still applies (the same probe refreshing its own result). One tuple
+        # comparison replaces the branch ladder.
+        return (
+            self._checked_at_value(incoming),
+            self._runtime_source_rank(incoming.get("source")),
+        ) >= (
+            self._checked_at_value(previous),
+            self._runtime_source_rank(previous.get("source")),
+        )
 
     def _record_runtime_tests(self, robot_id: str, updates: dict[str, dict[str, Any]]) -> None:
         normalized_robot_id = normalize_text(robot_id, "")
@@ -88,16 +84,29 @@ class RuntimeStateMixin:
                 self._mark_runtime_robot_dirty_locked(normalized_robot_id)
 
     def get_runtime_tests(self, robot_id: str) -> dict[str, dict[str, Any]]:
+        """Return the robot's runtime test state; treat the result as read-only.
+
+        Snapshots are cached against the per-robot version counter, so the
+        frequent poll-between-writes case costs one dict probe instead of
+        copying every payload; any recorded update invalidates by bumping
+        the version.
+        """
         normalized_robot_id = normalize_text(robot_id, "")
         if not normalized_robot_id:
             return {}
         with self._lock:
+            version = int(self._runtime_robot_versions.get(normalized_robot_id, 0))
+            cached = self._runtime_tests_snapshot_cache.get(normalized_robot_id)
+            if cached is not None and cached[0] == version:
+                return cached[1]
             existing = self._runtime_tests.get(normalized_robot_id, {})
-            return {
+            snapshot = {
                 test_id: dict(payload)
                 for test_id, payload in existing.items()
                 if isinstance(payload, dict)
             }
+            self._runtime_tests_snapshot_cache[normalized_robot_id] = (version, snapshot)
+            return snapshot
 
     def _build_runtime_activity_payload(self, payload: dict[str, Any] | None) -> dict[str, Any]:
         existing = payload if isinstance(payload, dict) else {}
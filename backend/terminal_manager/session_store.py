@@ -65,11 +65,37 @@ class SessionStoreMixin:
             self._maybe_evict_idle_locked(now=now)
             existing = self._handles.get(key)
             if existing:
-                existing.last_used = now
-                return existing.shell
+                # Pooled shells outlive individual requests; probe before
+                # handing one out and reconnect if the transport died in the
+                # meantime. Fakes without is_alive are treated as healthy.
+                checker = getattr(existing.shell, "is_alive", None)
+                if checker is None or checker():
+                    existing.last_used = now
+                    return existing.shell
+                self._close_handle(key)
 
         host, username, password, port = self._resolve_credentials(robot_id)
 
+        # Another live session to the same robot can donate its authenticated
+        # transport: a sibling channel skips the TCP/KEX/auth handshake.
+        # Any failure (donor mid-teardown, fake shells in tests) falls back
+        # to a fresh connection.
+        donor = None
+        with self._lock:
+            for (_, existing_robot_id), handle in self._handles.items():
+                if existing_robot_id == robot_id:
+                    donor = handle.shell
+                    break
+        if donor is not None:
+            try:
+                sibling = donor.spawn_channel()
+            except Exception:
+                sibling = None
+            if sibling is not None:
+                with self._lock:
+                    self._handles[key] = ShellHandle(shell=sibling, last_used=time.time())
+                return sibling
+
         from . import InteractiveShell
 
         shell = InteractiveShell(
@@ -93,6 +119,10 @@ class SessionStoreMixin:
         return shell
 
     def close_session(self, page_session_id: str, robot_id: str) -> None:
+        if page_session_id == self.AUTO_MONITOR_PAGE_SESSION_ID:
+            # The sourced ROS environment dies with the shell; force the next
+            # topics poll to rerun the setup command.
+            self._topics_setup_expiry.pop(robot_id, None)
         with self._lock:
             self._close_handle((page_session_id, robot_id))
 
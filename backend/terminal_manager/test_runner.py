@@ -1,37 +1,47 @@
 from __future__ import annotations
 
+import re
 import threading
 import time
 from typing import Any
 
-from ..normalization import normalize_status, normalize_text
+from ..normalization import normalize_status, normalize_str_fast, normalize_text
+
+_CONN_KEYWORDS_RE = re.compile(r"ssh|connect|auth", re.IGNORECASE)
+_CONN_ERROR_VALUES = frozenset({"execution_error", "command_error"})
+_OFFLINE_STALE_DETAILS = "Robot offline; non-online results are stale until tests rerun."
 
 
 class TestRunnerMixin:
     def _configured_test_ids(self, robot_id: str) -> list[str]:
         robot_type = self._resolve_robot_type(robot_id)
-        test_entries = robot_type.get("tests") if isinstance(robot_type, dict) else []
-        if not isinstance(test_entries, list):
-            return []
         ids: list[str] = []
         seen: set[str] = set()
-        for entry in test_entries:
-            if not isinstance(entry, dict):
-                continue
-            test_id = normalize_text(entry.get("id"), "")
-            if not test_id or test_id in seen:
+        # Robot types are canonicalized at registration: `tests` is always a
+        # list of dicts here.
+        for entry in robot_type.get("tests") or []:
+            test_id = normalize_str_fast(entry.get("id"), "")
+            if not test_id:
                 continue
             if entry.get("enabled", True) is False:
                 continue
+            # Add-and-compare-len dedupe: one hash per id instead of a
+            # membership probe followed by a separate add.
+            size_before = len(seen)
             seen.add(test_id)
-            ids.append(test_id)
+            if len(seen) != size_before:
+                ids.append(test_id)
         return ids
 
     def _auto_recovery_test_ids(self, robot_id: str) -> list[str]:
         return [test_id for test_id in self._configured_test_ids(robot_id) if test_id != "online"]
 
     def _selected_tests_all_ok(self, selected_test_ids: list[str], results: list[dict[str, Any]]) -> bool:
-        expected = [normalize_text(test_id, "") for test_id in selected_test_ids if normalize_text(test_id, "")]
+        expected = [
+            normalized
+            for test_id in selected_test_ids
+            if (normalized := normalize_text(test_id, ""))
+        ]
         if not expected:
             return True
 
@@ -88,16 +98,25 @@ class TestRunnerMixin:
         finally:
             elapsed = time.time() - started_at
             min_visible_sec = max(0.0, float(self.AUTO_ACTIVITY_MIN_VISIBLE_SEC))
-            if elapsed < min_visible_sec:
-                time.sleep(min_visible_sec - elapsed)
-            self._set_runtime_activity(robot_id, testing=False)
+            delay = min_visible_sec - elapsed
+            if delay <= 0.0:
+                self._set_runtime_activity(robot_id, testing=False)
+            else:
+                # Defer the visibility tail to a timer so the worker thread
+                # returns to the pool instead of sleeping out the UI window.
+                def _finalize() -> None:
+                    self._set_runtime_activity(robot_id, testing=False)
+
+                timer = threading.Timer(delay, _finalize)
+                timer.daemon = True
+                timer.start()
 
     def _runtime_non_online_test_ids(self, robot_id: str) -> list[str]:
         configured_non_online = [test_id for test_id in self._configured_test_ids(robot_id) if test_id != "online"]
         runtime_non_online = [
             test_id
-            for test_id in self.get_runtime_tests(robot_id).keys()
-            if normalize_text(test_id, "") and normalize_text(test_id, "") != "online"
+            for test_id in self.get_runtime_tests(robot_id)
+            if (normalized := normalize_text(test_id, "")) and normalized != "online"
         ]
         return list(dict.fromkeys([*configured_non_online, *runtime_non_online]))
 
@@ -109,6 +128,7 @@ class TestRunnerMixin:
         source: str,
     ) -> None:
         now = time.time()
+        normalized_source = normalize_text(source, "auto-monitor")
         valid_test_ids = set(self._configured_test_ids(robot_id))
         updates: dict[str, dict[str, Any]] = {}
         non_online_results: list[dict[str, Any]] = []
@@ -128,21 +148,26 @@ class TestRunnerMixin:
                 "details": normalize_text(result.get("details"), "No detail available"),
                 "ms": int(result.get("ms") or 0),
                 "checkedAt": now,
-                "source": normalize_text(source, "auto-monitor"),
+                "source": normalized_source,
             }
 
         if "online" not in updates and non_online_results:
-            any_non_error = any(normalize_status(result.get("status")) != "error" for result in non_online_results)
-            all_connectivity_failures = all(
-                normalize_status(result.get("status")) == "error"
-                and (
-                    "ssh" in normalize_text(result.get("details"), "").lower()
-                    or "connect" in normalize_text(result.get("details"), "").lower()
-                    or "auth" in normalize_text(result.get("details"), "").lower()
-                    or normalize_text(result.get("value"), "").lower() in {"execution_error", "command_error"}
-                )
-                for result in non_online_results
-            )
+            any_non_error = False
+            all_connectivity_failures = True
+            for result in non_online_results:
+                if normalize_status(result.get("status")) != "error":
+                    any_non_error = True
+                    all_connectivity_failures = False
+                else:
+                    details = normalize_text(result.get("details"), "")
+                    value_lower = normalize_text(result.get("value"), "").lower()
+                    if not (
+                        _CONN_KEYWORDS_RE.search(details)
+                        or value_lower in _CONN_ERROR_VALUES
+                    ):
+                        all_connectivity_failures = False
+                if any_non_error and not all_connectivity_failures:
+                    break
             if any_non_error:
                 updates["online"] = {
                     "status": "ok",
@@ -150,7 +175,7 @@ class TestRunnerMixin:
                     "details": "Inferred online: at least one test command executed.",
                     "ms": 0,
                     "checkedAt": now,
-                    "source": normalize_text(source, "auto-monitor"),
+                    "source": normalized_source,
                 }
             elif all_connectivity_failures:
                 updates["online"] = {
@@ -159,14 +184,14 @@ class TestRunnerMixin:
                     "details": "Inferred offline: automated tests failed for SSH/connectivity reasons.",
                     "ms": 0,
                     "checkedAt": now,
-                    "source": normalize_text(source, "auto-monitor"),
+                    "source": normalized_source,
                 }
         if updates:
             self._record_runtime_tests(robot_id, updates)
             configured_non_online_ids = {
                 test_id for test_id in self._configured_test_ids(robot_id) if test_id != "online"
             }
-            updated_non_online_ids = {test_id for test_id in updates.keys() if test_id != "online"}
+            updated_non_online_ids = updates.keys() - {"online"}
             if configured_non_online_ids and configured_non_online_ids.issubset(updated_non_online_ids):
                 last_full_test_checked_at = max(
                     float(payload.get("checkedAt") or now)
@@ -209,17 +234,19 @@ class TestRunnerMixin:
             }
         }
         if status != "ok":
-            stale_details = "Robot offline; non-online results are stale until tests rerun."
-            for test_id in self._runtime_non_online_test_ids(robot_id):
-                updates[test_id] = {
-                    "status": "warning",
-                    "value": "unknown",
-                    "reason": "OFFLINE_STALE",
-                    "details": stale_details,
-                    "ms": ms,
-                    "checkedAt": checked_at,
-                    "source": normalized_source,
-                }
+            stale_payload = {
+                "status": "warning",
+                "value": "unknown",
+                "reason": "OFFLINE_STALE",
+                "details": _OFFLINE_STALE_DETAILS,
+                "ms": ms,
+                "checkedAt": checked_at,
+                "source": normalized_source,
+            }
+            updates.update(
+                (test_id, stale_payload.copy())
+                for test_id in self._runtime_non_online_test_ids(robot_id)
+            )
 
         self._record_runtime_tests(robot_id, updates)
         return {
@@ -231,10 +258,12 @@ class TestRunnerMixin:
         }
 
     def _run_auto_recovery_tests(self, robot_id: str, *, source: str = "auto-monitor") -> None:
-        with self._lock:
-            if robot_id in self._auto_recovery_test_inflight:
-                return
-            self._auto_recovery_test_inflight.add(robot_id)
+        # dict.setdefault is atomic under the GIL, so a fresh token claims the
+        # robot without taking self._lock; losing the race returns another
+        # caller's token.
+        claim_token = object()
+        if self._auto_recovery_test_inflight.setdefault(robot_id, claim_token) is not claim_token:
+            return
 
         def _runner() -> None:
             try:
@@ -249,8 +278,7 @@ class TestRunnerMixin:
             except Exception:
                 pass
             finally:
-                with self._lock:
-                    self._auto_recovery_test_inflight.discard(robot_id)
+                self._auto_recovery_test_inflight.pop(robot_id, None)
 
         threading.Thread(target=_runner, daemon=True).start()
 
@@ -280,12 +308,9 @@ class TestRunnerMixin:
 
     def default_tests(self, robot_id: str) -> dict[str, dict[str, str]]:
         robot_type = self._resolve_robot_type(robot_id)
-        test_entries = robot_type.get("tests") if isinstance(robot_type, dict) else []
 
         defaults: dict[str, dict[str, str]] = {}
-        for entry in (test_entries or []):
-            if not isinstance(entry, dict):
-                continue
+        for entry in robot_type.get("tests") or []:
             test_id = normalize_text(entry.get("id"), "")
             if not test_id:
                 continue
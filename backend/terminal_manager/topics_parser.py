@@ -1,130 +1,238 @@
 from __future__ import annotations
 
 import json
+import re
+import sys
 import time
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import HTTPException
 
+try:  # Optional accelerator; stdlib json keeps the same observable payload.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from ..models import StepResult
-from ..normalization import normalize_status, normalize_text
+from ..normalization import (
+    dict_or_empty,
+    normalize_status,
+    normalize_str_fast,
+    normalize_text,
+    normalize_type_key,
+)
+
+_TOPIC_LINE_RE = re.compile(r"(?m)^[ \t]*(/\S+)[ \t\r]*$")
+_SKIP_TEST_IDS = frozenset({"online", "battery"})
+_TOPICS_RUNTIME_ERROR_TEMPLATE = {
+    "status": "error",
+    "value": "missing",
+    "details": "",
+    "ms": 0,
+    "checkedAt": 0.0,
+    "source": "auto-monitor-topics",
+}
+
+
+def _dumps_sorted(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(payload, sort_keys=True)
+
+
+def _normalize_nonempty(items: Any) -> list[str]:
+    """Normalize each item once, keeping only non-empty results."""
+    out: list[str] = []
+    for item in items or ():
+        value = normalize_text(item, "")
+        if value:
+            out.append(value)
+    return out
+
+
+@dataclass(slots=True, frozen=True)
+class TopicTestSpec:
+    """Fully normalized topic test, ready to feed the presence parser."""
+
+    test_id: str
+    expected_topics: tuple[str, ...]
+    namespace: str
 
 
 class TopicsParserMixin:
-    def _build_topics_runtime_error(self, details: str) -> dict[str, Any]:
-        return {
-            "status": "error",
-            "value": "missing",
-            "details": normalize_text(details, "Unable to run topic snapshot."),
-            "ms": 0,
-            "checkedAt": time.time(),
-            "source": "auto-monitor-topics",
-        }
+    def _build_topics_runtime_error(self, details: str, checked_at: float | None = None) -> dict[str, Any]:
+        payload = _TOPICS_RUNTIME_ERROR_TEMPLATE.copy()
+        payload["details"] = normalize_text(details, "Unable to run topic snapshot.")
+        payload["checkedAt"] = checked_at if checked_at is not None else time.time()
+        return payload
 
-    def _topic_tests_for_robot(self, robot_id: str) -> list[dict[str, Any]]:
-        robot_type = self._resolve_robot_type(robot_id)
-        raw_tests = robot_type.get("tests") if isinstance(robot_type, dict) else []
-        if not isinstance(raw_tests, list):
-            return []
+    def _compile_topic_test_specs(self, robot_type: dict[str, Any]) -> list[TopicTestSpec]:
+        """Partially evaluate the topic-test pipeline for a robot type.
 
-        selected: list[dict[str, Any]] = []
-        for entry in raw_tests:
-            if not isinstance(entry, dict):
-                continue
-            test_id = normalize_text(entry.get("id"), "")
-            if not test_id or test_id in {"online", "battery"}:
-                continue
+        All config walking and normalization happens here once; the refresh
+        loop only consumes the compiled specs.
+        """
+        specs: list[TopicTestSpec] = []
+        # Robot types are canonicalized at registration: `tests` is always a
+        # list of dicts here.
+        for entry in robot_type.get("tests") or []:
             if entry.get("enabled", True) is False:
                 continue
-            params = entry.get("params") if isinstance(entry.get("params"), dict) else {}
-            required_topics = [
-                normalize_text(topic, "")
-                for topic in (params.get("requiredTopics") or entry.get("requiredTopics") or [])
-                if normalize_text(topic, "")
-            ]
+            test_id = normalize_str_fast(entry.get("id"), "")
+            if not test_id or test_id in _SKIP_TEST_IDS:
+                continue
+            params = dict_or_empty(entry.get("params"))
+            required_topics = _normalize_nonempty(
+                params.get("requiredTopics") or entry.get("requiredTopics")
+            )
             if not required_topics:
                 continue
-            selected.append(entry)
-        return selected
+            namespace = normalize_text(
+                params.get("namespace") or entry.get("namespace"),
+                "",
+            )
+            # Interned topic names are shared across tests that require the
+            # same topics, so downstream set membership hits pointer equality.
+            specs.append(
+                TopicTestSpec(
+                    test_id=sys.intern(test_id),
+                    expected_topics=tuple(sys.intern(topic) for topic in required_topics),
+                    namespace=sys.intern(namespace),
+                )
+            )
+        return specs
+
+    def _topic_tests_for_robot(self, robot_id: str) -> list[TopicTestSpec]:
+        robot_type = self._resolve_robot_type(robot_id)
+        robot = self.robots_by_id.get(robot_id)
+        type_key = normalize_type_key(robot.get("type")) if isinstance(robot, dict) else ""
+        if not type_key:
+            return self._compile_topic_test_specs(robot_type)
+
+        version = int(getattr(self, "_definitions_version", 0))
+        cached = self._topic_tests_cache.get(type_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        specs = self._compile_topic_test_specs(robot_type)
+        self._topic_tests_cache[type_key] = (version, specs)
+        return specs
 
     def _refresh_topics_state(self, robot_id: str) -> None:
+        # Coalesce concurrent refreshes: a snapshot blocks for up to the
+        # topics timeout, so a second caller inside that window just reuses
+        # the in-flight result (best-effort, same as the monitor semantics).
+        claim_token = object()
+        if self._topics_refresh_inflight.setdefault(robot_id, claim_token) is not claim_token:
+            return
+        try:
+            self._refresh_topics_state_impl(robot_id)
+        finally:
+            self._topics_refresh_inflight.pop(robot_id, None)
+
+    def _refresh_topics_state_impl(self, robot_id: str) -> None:
         topic_tests = self._topic_tests_for_robot(robot_id)
         if not topic_tests:
             return
 
+        page_session_id = self.AUTO_MONITOR_PAGE_SESSION_ID
         try:
-            self.run_command(
-                page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID,
-                robot_id=robot_id,
-                command=self.AUTO_MONITOR_TOPICS_SETUP_COMMAND,
-                timeout_sec=3.0,
-            )
-            started_ms = int(time.time() * 1000)
+            # The setup command is idempotent and its effect persists for the
+            # life of the shell; when it is due, chain it in front of the
+            # snapshot command so each poll costs one terminal round-trip.
+            now = time.time()
+            setup_due = now >= self._topics_setup_expiry.get(robot_id, 0.0)
+            if setup_due:
+                command = f"{self.AUTO_MONITOR_TOPICS_SETUP_COMMAND}; {self.AUTO_MONITOR_TOPICS_COMMAND}"
+                timeout_sec = 3.0 + float(self.AUTO_MONITOR_TOPICS_TIMEOUT_SEC)
+            else:
+                command = self.AUTO_MONITOR_TOPICS_COMMAND
+                timeout_sec = self.AUTO_MONITOR_TOPICS_TIMEOUT_SEC
+            started_ns = time.monotonic_ns()
             output = self.run_command(
-                page_session_id=self.AUTO_MONITOR_PAGE_SESSION_ID,
+                page_session_id=page_session_id,
                 robot_id=robot_id,
-                command=self.AUTO_MONITOR_TOPICS_COMMAND,
-                timeout_sec=self.AUTO_MONITOR_TOPICS_TIMEOUT_SEC,
+                command=command,
+                timeout_sec=timeout_sec,
             )
-            elapsed_ms = max(0, int(time.time() * 1000 - started_ms))
+            elapsed_ms = max(0, (time.monotonic_ns() - started_ns) // 1_000_000)
+            if setup_due:
+                self._topics_setup_expiry[robot_id] = now + self.AUTO_MONITOR_TOPICS_SETUP_TTL_SEC
         except HTTPException as exc:
-            details = normalize_text(exc.detail, "Unable to run topic snapshot.")
-            updates = {
-                normalize_text(entry.get("id"), ""): self._build_topics_runtime_error(details)
-                for entry in topic_tests
-                if normalize_text(entry.get("id"), "")
-            }
-            if updates:
-                self._record_runtime_tests(robot_id, updates)
+            self._topics_setup_expiry.pop(robot_id, None)
+            self._record_topics_failure(
+                robot_id,
+                topic_tests,
+                normalize_text(exc.detail, "Unable to run topic snapshot."),
+            )
             return
 
+        self._record_topics_output(robot_id, topic_tests, output, elapsed_ms)
+
+    def _record_topics_failure(self, robot_id: str, topic_tests: list[TopicTestSpec], detail: str) -> None:
+        error_payload = self._build_topics_runtime_error(detail, checked_at=time.time())
+        updates = {spec.test_id: dict(error_payload) for spec in topic_tests}
+        if updates:
+            self._record_runtime_tests(robot_id, updates)
+
+    def _record_topics_output(
+        self,
+        robot_id: str,
+        topic_tests: list[TopicTestSpec],
+        output: str,
+        elapsed_ms: int,
+    ) -> None:
+        checked_at = time.time()
+        present_pair = self._extract_present_topics(output)
+        parse_topics = self._parse_topics_presence_impl
         updates: dict[str, dict[str, Any]] = {}
-        for entry in topic_tests:
-            test_id = normalize_text(entry.get("id"), "")
-            if not test_id:
-                continue
-            params = entry.get("params") if isinstance(entry.get("params"), dict) else {}
-            namespace = normalize_text(
-                params.get("namespace") or entry.get("namespace"),
-                "",
-            )
-            parsed = self._parse_topics_presence_impl(
+        for spec in topic_tests:
+            parsed = parse_topics(
                 raw_output=output,
-                expected_topics=[
-                    normalize_text(topic, "")
-                    for topic in (params.get("requiredTopics") or entry.get("requiredTopics") or [])
-                    if normalize_text(topic, "")
-                ],
-                namespace=namespace,
+                expected_topics=spec.expected_topics,
+                namespace=spec.namespace,
+                present_pair=present_pair,
             )
-            updates[test_id] = {
+            updates[spec.test_id] = {
                 "status": normalize_status(parsed.status),
                 "value": normalize_text(parsed.value, "missing"),
                 "details": normalize_text(parsed.details, "Missing required topics."),
                 "ms": elapsed_ms,
-                "checkedAt": time.time(),
+                "checkedAt": checked_at,
                 "source": "auto-monitor-topics",
             }
 
         if updates:
             self._record_runtime_tests(robot_id, updates)
 
+    def _extract_present_topics(self, raw_output: str) -> tuple[list[str], frozenset[str], dict[str, str]]:
+        output_lines = _TOPIC_LINE_RE.findall(str(raw_output or ""))
+        present_set = frozenset(output_lines)
+        present = sorted(present_set)
+        # Index each listed topic by its slash-boundary suffixes so expected
+        # topics resolve with one dict lookup instead of scanning all of
+        # `present` per topic. First (sorted) listed topic wins per suffix.
+        suffix_map: dict[str, str] = {}
+        for listed_topic in present:
+            parts = listed_topic.split("/")
+            if parts[0] != "":
+                continue
+            for index in range(2, len(parts)):
+                suffix_map.setdefault("/".join(parts[index:]), listed_topic)
+        return present, present_set, suffix_map
+
     def _parse_topics_presence_impl(
         self,
         raw_output: str,
-        expected_topics: list[str],
+        expected_topics: list[str] | tuple[str, ...],
         namespace: str = "",
+        present_pair: tuple[list[str], frozenset[str], dict[str, str]] | None = None,
     ) -> StepResult:
-        output_lines = []
-        for line in str(raw_output or "").replace("\r", "").split("\n"):
-            candidate = line.strip()
-            if not candidate:
-                continue
-            if candidate.startswith("/"):
-                output_lines.append(candidate)
-
-        present = sorted({line for line in output_lines})
-        expected = sorted({normalize_text(topic, "") for topic in (expected_topics or []) if normalize_text(topic, "")})
+        if present_pair is None:
+            present_pair = self._extract_present_topics(raw_output)
+        present, present_set, suffix_map = present_pair
+        expected = sorted(set(_normalize_nonempty(expected_topics)))
+        expected_set = set(expected)
         expected_namespace = normalize_text(namespace, "")
         if expected_namespace and not expected_namespace.startswith("/"):
             expected_namespace = f"/{expected_namespace}"
@@ -132,19 +240,15 @@ class TopicsParserMixin:
         matched_by_namespace: dict[str, str] = {}
         detected_namespaces: set[str] = set()
         for topic in expected:
-            if topic in present:
+            if topic in present_set:
+                continue
+            suffix_key = topic.lstrip("/")
+            listed_topic = suffix_map.get(suffix_key)
+            if not listed_topic or listed_topic == topic:
                 continue
-            for listed_topic in present:
-                if not listed_topic.endswith(topic) or listed_topic == topic:
-                    continue
-                namespace_prefix = listed_topic[: -len(topic)]
-                if namespace_prefix.endswith("/"):
-                    namespace_prefix = namespace_prefix[:-1]
-                if not namespace_prefix.startswith("/") or namespace_prefix == "/":
-                    continue
-                matched_by_namespace[topic] = listed_topic
-                detected_namespaces.add(namespace_prefix)
-                break
+            namespace_prefix = listed_topic[: -len(suffix_key)].rstrip("/")
+            matched_by_namespace[topic] = listed_topic
+            detected_namespaces.add(namespace_prefix)
 
         namespace_present = False
         if expected_namespace:
@@ -157,6 +261,16 @@ class TopicsParserMixin:
         if matched_by_namespace:
             namespace_present = True
 
+        detected_sorted = sorted(detected_namespaces)
+        payload = {
+            "expectedTopics": expected,
+            "presentTopics": present,
+            "namespace": expected_namespace,
+            "namespacePresent": namespace_present,
+            "detectedNamespaces": detected_sorted,
+            "matchedByNamespace": matched_by_namespace,
+        }
+
         if not expected:
             return StepResult(
                 id="topics_presence",
@@ -164,47 +278,27 @@ class TopicsParserMixin:
                 value="no_expected_topics",
                 details="Robot type does not define required topics.",
                 ms=0,
-                output=json.dumps(
-                    {
-                        "expectedTopics": expected,
-                        "presentTopics": present,
-                        "namespace": expected_namespace,
-                        "namespacePresent": namespace_present,
-                        "detectedNamespaces": sorted(detected_namespaces),
-                        "matchedByNamespace": matched_by_namespace,
-                    },
-                    sort_keys=True,
-                ),
+                output=_dumps_sorted(payload),
             )
 
-        missing = sorted(set(expected) - set(present) - set(matched_by_namespace))
+        missing = sorted(expected_set - present_set - matched_by_namespace.keys())
         if missing:
             details = f"Missing topics: {', '.join(missing)}"
-            if detected_namespaces:
-                details = f"{details}. Namespace(s) detected: {', '.join(sorted(detected_namespaces))}"
+            if detected_sorted:
+                details = f"{details}. Namespace(s) detected: {', '.join(detected_sorted)}"
+            payload["missingTopics"] = missing
             return StepResult(
                 id="topics_presence",
                 status="error",
                 value="missing",
                 details=details,
                 ms=0,
-                output=json.dumps(
-                    {
-                        "expectedTopics": expected,
-                        "presentTopics": present,
-                        "missingTopics": missing,
-                        "namespace": expected_namespace,
-                        "namespacePresent": namespace_present,
-                        "detectedNamespaces": sorted(detected_namespaces),
-                        "matchedByNamespace": matched_by_namespace,
-                    },
-                    sort_keys=True,
-                ),
+                output=_dumps_sorted(payload),
             )
 
         details = "All required topics present"
-        if detected_namespaces:
-            details = f"{details}. Namespace(s) detected: {', '.join(sorted(detected_namespaces))}"
+        if detected_sorted:
+            details = f"{details}. Namespace(s) detected: {', '.join(detected_sorted)}"
         elif expected_namespace:
             details = f"{details}. Namespace '{expected_namespace}' not found."
 
@@ -214,24 +308,9 @@ class TopicsParserMixin:
             value="all_present",
             details=details,
             ms=0,
-            output=json.dumps(
-                {
-                    "expectedTopics": expected,
-                    "presentTopics": present,
-                    "namespace": expected_namespace,
-                    "namespacePresent": namespace_present,
-                    "detectedNamespaces": sorted(detected_namespaces),
-                    "matchedByNamespace": matched_by_namespace,
-                },
-                sort_keys=True,
-            ),
+            output=_dumps_sorted(payload),
         )
 
     # Compatibility surface for existing tests that probe parser internals.
-    def _parse_topics_presence(
-        self,
-        raw_output: str,
-        expected_topics: list[str],
-        namespace: str = "",
-    ) -> StepResult:
-        return self._parse_topics_presence_impl(raw_output, expected_topics, namespace)
+    # A direct alias keeps the name without paying a forwarding frame.
+    _parse_topics_presence = _parse_topics_presence_impl
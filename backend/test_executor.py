@@ -2,25 +2,37 @@ from __future__ import annotations
 
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 from fastapi import HTTPException
 
 from .connectors import OrchestrateConnector, ReadConnector, WriteConnector
-from .normalization import normalize_status, normalize_text
+from .normalization import dict_or_empty, normalize_status, normalize_text, safe_float
 from .ssh_client import InteractiveShell
 
+_DRY_RUN_ONLINE_TEMPLATE = {
+    "status": "warning",
+    "value": "pending",
+    "details": "Dry-run mode: online check skipped.",
+    "ms": 0,
+}
+
 
 class TestExecutor:
     RESOLVER_SOURCE = "resolver"
+    # Upper bound on concurrent definition groups per run; each worker holds
+    # its own SSH channel, so this also caps extra channels per robot.
+    MAX_PARALLEL_DEFINITIONS = 4
+    # Back-to-back online checks within this window reuse the last probe
+    # instead of opening another connection.
+    ONLINE_PROBE_TTL_SEC = 2.0
 
     def __init__(
         self,
         robot_types_by_id: dict[str, dict[str, Any]],
         resolve_robot_type: Callable[[str], dict[str, Any]],
-        resolve_credentials: Callable[[str], tuple[str, str, str, int]],
         get_or_connect: Callable[[str, str], InteractiveShell],
-        close_session: Callable[[str, str], None],
         check_online: Callable[[str], dict[str, Any]],
         test_definitions_by_id: dict[str, dict[str, Any]] | None = None,
         check_definitions_by_id: dict[str, dict[str, Any]] | None = None,
@@ -28,9 +40,7 @@ class TestExecutor:
     ):
         self.robot_types_by_id = robot_types_by_id
         self._resolve_robot_type = resolve_robot_type
-        self._resolve_credentials = resolve_credentials
         self._get_or_connect = get_or_connect
-        self._close_session = close_session
         self._check_online = check_online
         self._test_definitions_by_id = test_definitions_by_id or {}
         self._check_definitions_by_id = check_definitions_by_id or {}
@@ -38,6 +48,17 @@ class TestExecutor:
             read=ReadConnector(),
             write=WriteConnector({}),
         )
+        # Resolution cache keyed by robot-type object identity plus the
+        # requested id tuple; entries pin the robot-type dict so the id stays
+        # valid, and reloads swap those dicts, which invalidates by identity.
+        self._resolve_cache: dict[
+            tuple[int, tuple[str, ...]],
+            tuple[dict[str, Any], Any, tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]],
+        ] = {}
+        self._online_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Cross-request command cache; only definitions that opt in with a
+        # cacheTtlSec participate.
+        self._command_ttl_cache: dict[tuple[str, str, str], tuple[float, str]] = {}
 
     def _build_error_result(
         self,
@@ -48,13 +69,16 @@ class TestExecutor:
         error_code: str,
         source: str = RESOLVER_SOURCE,
     ) -> dict[str, Any]:
+        # value/errorCode/source are always caller-supplied literals already
+        # in canonical form; only id and details carry dynamic text. Error
+        # emission stays cheap when a whole group fails at once.
         return {
             "id": normalize_text(test_id, "test"),
             "status": "error",
-            "value": normalize_text(value, "execution_error"),
+            "value": value or "execution_error",
             "details": normalize_text(details, "Test resolution failed."),
-            "errorCode": normalize_text(error_code, "resolution_error"),
-            "source": normalize_text(source, self.RESOLVER_SOURCE),
+            "errorCode": error_code or "resolution_error",
+            "source": source or self.RESOLVER_SOURCE,
             "ms": 0,
             "steps": [],
         }
@@ -78,6 +102,14 @@ class TestExecutor:
             requested.add(normalized_test_id)
             requested_ids.append(normalized_test_id)
 
+        cache_key = (id(robot_type), tuple(requested_ids))
+        cached = self._resolve_cache.get(cache_key)
+        if cached is not None:
+            cached_type, cached_entries, payload = cached
+            if cached_type is robot_type and (robot_type.get("tests") or []) is cached_entries:
+                return payload
+            self._resolve_cache.pop(cache_key, None)
+
         resolved: list[dict[str, Any]] = []
         resolution_errors: list[dict[str, Any]] = []
         matched_requested: set[str] = set()
@@ -123,17 +155,36 @@ class TestExecutor:
                 )
                 continue
 
-            merged = dict(entry)
-            merged["id"] = test_id
-            merged["definitionId"] = definition_id
-            merged["params"] = dict(merged.get("params") if isinstance(merged.get("params"), dict) else {})
-            resolved.append(merged)
+            # Downstream only reads these five keys, so a flat spec dict
+            # replaces the full entry copy. params shares the entry's dict
+            # (consumers merge it into fresh dicts, never mutate it), and a
+            # plain dataclass/namedtuple was rejected to keep specs walking
+            # through the same .get() paths as the rest of the pipeline.
+            resolved.append(
+                {
+                    "id": test_id,
+                    "definitionId": definition_id,
+                    "params": dict_or_empty(entry.get("params")),
+                    "defaultValue": entry.get("defaultValue"),
+                    "defaultDetails": entry.get("defaultDetails"),
+                }
+            )
 
         unknown_requested = [test_id for test_id in requested_ids if test_id not in matched_requested]
-        return resolved, resolution_errors, unknown_requested
+        payload = (resolved, resolution_errors, unknown_requested)
+        self._resolve_cache[cache_key] = (robot_type, test_entries, payload)
+        return payload
 
     def _run_online_test(self, robot_id: str) -> dict[str, Any]:
-        result = self._check_online(robot_id)
+        # Coalesce bursts of online checks (UI polls, batch runs that each
+        # re-verify reachability) onto one probe per TTL window.
+        now = time.monotonic()
+        cached = self._online_cache.get(robot_id)
+        if cached is not None and now - cached[0] < self.ONLINE_PROBE_TTL_SEC:
+            result = cached[1]
+        else:
+            result = self._check_online(robot_id)
+            self._online_cache[robot_id] = (now, result)
         status = normalize_status(result.get("status"))
         details = normalize_text(result.get("details"), "No detail available")
         ms = int(result.get("ms") or 0)
@@ -169,28 +220,32 @@ class TestExecutor:
         shared_execution_id: str,
         total_ms: int,
     ) -> dict[str, Any]:
-        test_id = normalize_text(test_spec.get("id"), "test")
-        status = normalize_status(output_payload.get("status"))
-        value = normalize_text(output_payload.get("value"), normalize_text(test_spec.get("defaultValue"), "n/a"))
-        details = normalize_text(
-            output_payload.get("details"), normalize_text(test_spec.get("defaultDetails"), "No detail available")
-        )
+        # Local aliases skip the module-global lookup per field, and the
+        # test-spec defaults are constants of the spec - normalize them once
+        # instead of once per payload field.
+        _nt = normalize_text
+        _ns = normalize_status
+        default_value = _nt(test_spec.get("defaultValue"), "n/a")
+        default_details = _nt(test_spec.get("defaultDetails"), "No detail available")
+
+        test_id = _nt(test_spec.get("id"), "test")
+        status = _ns(output_payload.get("status"))
+        value = _nt(output_payload.get("value"), default_value)
+        details = _nt(output_payload.get("details"), default_details)
         ms = int(output_payload.get("ms") or total_ms)
 
-        normalized_steps = []
-        for step in steps:
-            if not isinstance(step, dict):
-                continue
-            normalized_steps.append(
-                {
-                    "id": normalize_text(step.get("id"), "step"),
-                    "status": normalize_status(step.get("status")),
-                    "value": normalize_text(step.get("value"), "n/a"),
-                    "details": normalize_text(step.get("details"), "No detail available"),
-                    "ms": int(step.get("ms") or 0),
-                    "output": step.get("output", ""),
-                }
-            )
+        normalized_steps = [
+            {
+                "id": _nt(step.get("id"), "step"),
+                "status": _ns(step.get("status")),
+                "value": _nt(step.get("value"), "n/a"),
+                "details": _nt(step.get("details"), "No detail available"),
+                "ms": int(step.get("ms") or 0),
+                "output": step.get("output", ""),
+            }
+            for step in steps
+            if isinstance(step, dict)
+        ]
 
         return {
             "id": test_id,
@@ -223,21 +278,17 @@ class TestExecutor:
             raise HTTPException(status_code=400, detail=f"Unknown definition '{definition_id}'")
 
         mode = normalize_text(definition.get("mode"), "orchestrate")
-        shared_execution_id = f"def-{definition_id}-{uuid.uuid4().hex[:8]}"
+        # Dry runs never need a unique id, so skip the entropy call for them.
+        if dry_run:
+            shared_execution_id = f"def-{definition_id}-dryrun"
+        else:
+            shared_execution_id = f"def-{definition_id}-{uuid.uuid4().hex[:8]}"
 
         if mode == "online_probe":
             check_ids = [normalize_text(check.get("id"), "") for check in (definition.get("checks") or []) if isinstance(check, dict)]
             check_ids = [check_id for check_id in check_ids if check_id]
             if dry_run:
-                outputs = {
-                    check_id: {
-                        "status": "warning",
-                        "value": "pending",
-                        "details": "Dry-run mode: online check skipped.",
-                        "ms": 0,
-                    }
-                    for check_id in check_ids
-                }
+                outputs = {check_id: _DRY_RUN_ONLINE_TEMPLATE.copy() for check_id in check_ids}
                 return {
                     "outputs": outputs,
                     "steps": [],
@@ -263,20 +314,34 @@ class TestExecutor:
             }
 
         shell = self._get_or_connect(page_session_id, robot_id)
-        started = int(time.time() * 1000)
+        started_ns = time.monotonic_ns()
 
         merged_params: dict[str, Any] = {}
-        definition_params = definition.get("params") if isinstance(definition.get("params"), dict) else {}
-        merged_params.update(definition_params)
+        merged_params.update(dict_or_empty(definition.get("params")))
         if len(check_specs) == 1:
-            one_params = check_specs[0].get("params") if isinstance(check_specs[0].get("params"), dict) else {}
-            merged_params.update(one_params)
-        merged_params["requestedCheckIds"] = [normalize_text(item.get("id"), "") for item in check_specs]
+            merged_params.update(dict_or_empty(check_specs[0].get("params")))
+        # _resolve_tests guarantees every spec carries a normalized id.
+        merged_params["requestedCheckIds"] = [item["id"] for item in check_specs]
+
+        # Definitions may opt in to reusing identical command output across
+        # successive runs (polling dashboards re-running e.g. a topics list)
+        # by declaring cacheTtlSec; default stays uncached.
+        cache_ttl_sec = safe_float(definition.get("cacheTtlSec"), 0.0)
 
         def _run_command(command: str, timeout_sec: float | None) -> str:
-            self._resolve_credentials(robot_id)
             timeout = timeout_sec if timeout_sec is not None else 12.0
-            return shell.run_command(command, timeout=float(timeout))
+            if cache_ttl_sec <= 0.0:
+                return shell.run_command(command, timeout=float(timeout))
+            cache_key = (page_session_id, robot_id, command)
+            now = time.monotonic()
+            entry = self._command_ttl_cache.get(cache_key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            output = shell.run_command(command, timeout=float(timeout))
+            if len(self._command_ttl_cache) > 256:
+                self._prune_command_ttl_cache(now)
+            self._command_ttl_cache[cache_key] = (now + cache_ttl_sec, output)
+            return output
 
         orchestrated = self._orchestrate.run_definition(
             definition,
@@ -286,7 +351,7 @@ class TestExecutor:
             dry_run=dry_run,
             command_cache=command_output_cache,
         )
-        total_ms = max(0, int(time.time() * 1000 - started))
+        total_ms = max(0, (time.monotonic_ns() - started_ns) // 1_000_000)
 
         return {
             "outputs": orchestrated.get("checkResults") if isinstance(orchestrated.get("checkResults"), dict) else {},
@@ -295,6 +360,11 @@ class TestExecutor:
             "ms": total_ms,
         }
 
+    def _prune_command_ttl_cache(self, now: float) -> None:
+        expired = [key for key, (expires_at, _) in self._command_ttl_cache.items() if now >= expires_at]
+        for key in expired:
+            self._command_ttl_cache.pop(key, None)
+
     def run_tests(
         self,
         robot_id: str,
@@ -321,7 +391,9 @@ class TestExecutor:
         results.extend(resolution_errors)
 
         command_output_cache: dict[str, str] = {}
-        run_scope = f"{robot_id}:{page_session_id}:{int(time.time() * 1000)}"
+        # Wall clock is only an id salt here; elapsed timing below runs on the
+        # monotonic clock. time_ns avoids the float multiply-cast.
+        run_scope = f"{robot_id}:{page_session_id}:{time.time_ns() // 1_000_000}"
 
         definition_groups: dict[str, list[dict[str, Any]]] = {}
         for spec in tests:
@@ -329,82 +401,127 @@ class TestExecutor:
             if definition_id:
                 definition_groups.setdefault(definition_id, []).append(spec)
 
-        try:
+        # Sessions are deliberately left open: the session store keeps them
+        # keyed by (page session, robot) with its own idle reaper, so the next
+        # run skips the TCP + key-exchange + auth handshake entirely.
+        if len(definition_groups) <= 1:
             for definition_id, grouped_specs in definition_groups.items():
-                try:
-                    execution = self._execute_definition_once(
+                results.extend(
+                    self._run_definition_group(
                         robot_id=robot_id,
                         page_session_id=page_session_id,
                         definition_id=definition_id,
-                        check_specs=grouped_specs,
+                        grouped_specs=grouped_specs,
                         dry_run=dry_run,
                         command_output_cache=command_output_cache,
                         run_scope=run_scope,
                     )
-                except HTTPException as exc:
-                    for spec in grouped_specs:
-                        results.append(
-                            {
-                                "id": normalize_text(spec.get("id"), "test"),
-                                "status": "error",
-                                "value": "execution_error",
-                                "details": exc.detail,
-                                "errorCode": "execution_error",
-                                "source": "executor",
-                                "ms": 0,
-                                "steps": [],
-                            }
-                        )
-                    continue
-                except Exception as exc:
-                    for spec in grouped_specs:
-                        results.append(
-                            {
-                                "id": normalize_text(spec.get("id"), "test"),
-                                "status": "error",
-                                "value": "execution_error",
-                                "details": f"Test execution failed: {exc}",
-                                "errorCode": "execution_error",
-                                "source": "executor",
-                                "ms": 0,
-                                "steps": [],
-                            }
-                        )
-                    continue
-
-                outputs = execution.get("outputs") if isinstance(execution.get("outputs"), dict) else {}
-                steps = execution.get("steps") if isinstance(execution.get("steps"), list) else []
-                shared_execution_id = normalize_text(
-                    execution.get("sharedExecutionId"),
-                    f"def-{definition_id}-{uuid.uuid4().hex[:8]}",
                 )
-                total_ms = int(execution.get("ms") or 0)
-
-                for spec in grouped_specs:
-                    test_id = normalize_text(spec.get("id"), "test")
-                    payload = outputs.get(test_id)
-                    if not isinstance(payload, dict):
-                        results.append(
-                            self._build_error_result(
-                                test_id=test_id,
-                                value="missing_output",
-                                details=f"Definition '{definition_id}' did not emit output '{test_id}'.",
-                                error_code="definition_output_missing",
-                                source="executor",
-                            )
-                        )
-                        continue
-                    results.append(
-                        self._normalize_check_output_result(
-                            test_spec=spec,
-                            output_payload=payload,
-                            steps=steps,
+        else:
+            # Independent definitions spend most of their wall time waiting
+            # on SSH round-trips, so fan them out over worker threads, each
+            # holding its own channel (keyed by a suffixed session id).
+            # Results keep definition-group order regardless of completion
+            # order.
+            max_workers = min(self.MAX_PARALLEL_DEFINITIONS, len(definition_groups))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = []
+                for index, (definition_id, grouped_specs) in enumerate(definition_groups.items()):
+                    pooled_session_id = f"{page_session_id}::par-{index}"
+                    futures.append(
+                        pool.submit(
+                            self._run_definition_group,
+                            robot_id=robot_id,
+                            page_session_id=pooled_session_id,
                             definition_id=definition_id,
-                            shared_execution_id=shared_execution_id,
-                            total_ms=total_ms,
+                            grouped_specs=grouped_specs,
+                            dry_run=dry_run,
+                            command_output_cache=command_output_cache,
+                            run_scope=run_scope,
                         )
                     )
-        finally:
-            self._close_session(page_session_id, robot_id)
+                for future in futures:
+                    results.extend(future.result())
 
         return results
+
+    def _emit_group_error(self, specs: list[dict[str, Any]], details: str) -> list[dict[str, Any]]:
+        """Fan one execution failure out to every check in the group."""
+        return [
+            {
+                "id": normalize_text(spec.get("id"), "test"),
+                "status": "error",
+                "value": "execution_error",
+                "details": details,
+                "errorCode": "execution_error",
+                "source": "executor",
+                "ms": 0,
+                "steps": [],
+            }
+            for spec in specs
+        ]
+
+    def _run_definition_group(
+        self,
+        *,
+        robot_id: str,
+        page_session_id: str,
+        definition_id: str,
+        grouped_specs: list[dict[str, Any]],
+        dry_run: bool,
+        command_output_cache: dict[str, str],
+        run_scope: str,
+    ) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        try:
+            execution = self._execute_definition_once(
+                robot_id=robot_id,
+                page_session_id=page_session_id,
+                definition_id=definition_id,
+                check_specs=grouped_specs,
+                dry_run=dry_run,
+                command_output_cache=command_output_cache,
+                run_scope=run_scope,
+            )
+        except HTTPException as exc:
+            return self._emit_group_error(grouped_specs, exc.detail)
+        except Exception as exc:
+            return self._emit_group_error(grouped_specs, f"Test execution failed: {exc}")
+
+        outputs = dict_or_empty(execution.get("outputs"))
+        raw_exec_steps = execution.get("steps")
+        steps = raw_exec_steps if isinstance(raw_exec_steps, list) else []
+        # The or-fallback keeps UUID generation off the common path where the
+        # execution already supplied its id (eager default arguments are
+        # evaluated even on hits).
+        shared_execution_id = (
+            normalize_text(execution.get("sharedExecutionId"), "")
+            or f"def-{definition_id}-{uuid.uuid4().hex[:8]}"
+        )
+        total_ms = int(execution.get("ms") or 0)
+
+        for spec in grouped_specs:
+            test_id = normalize_text(spec.get("id"), "test")
+            payload = outputs.get(test_id)
+            if not isinstance(payload, dict):
+                results.append(
+                    self._build_error_result(
+                        test_id=test_id,
+                        value="missing_output",
+                        details=f"Definition '{definition_id}' did not emit output '{test_id}'.",
+                        error_code="definition_output_missing",
+                        source="executor",
+                    )
+                )
+                continue
+            results.append(
+                self._normalize_check_output_result(
+                    test_spec=spec,
+                    output_payload=payload,
+                    steps=steps,
+                    definition_id=definition_id,
+                    shared_execution_id=shared_execution_id,
+                    total_ms=total_ms,
+                )
+            )
+        return results
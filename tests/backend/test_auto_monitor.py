@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import socket
 import threading
 import time
 
+from backend.ssh_client import InteractiveShell
 from backend.terminal_manager import TerminalManager
 import backend.terminal_manager as tm_module
 
@@ -137,6 +139,53 @@ def test_reload_definitions_prunes_runtime_tests_not_in_robot_type_catalog():
     assert "legacy_removed_check" not in runtime
 
 
+def test_interactive_shell_enables_tcp_nodelay_and_keepalive():
+    recorded = {"setsockopt": [], "keepalive": None}
+
+    class FakeSock:
+        def setsockopt(self, level, option, value):
+            recorded["setsockopt"].append((level, option, value))
+
+    class FakeTransport:
+        sock = FakeSock()
+
+        def set_keepalive(self, interval):
+            recorded["keepalive"] = interval
+
+    class FakeChan:
+        def settimeout(self, timeout):
+            return None
+
+        def recv(self, nbytes):
+            raise socket.timeout()
+
+        def close(self):
+            return None
+
+    class FakeClient:
+        def set_missing_host_key_policy(self, policy):
+            return None
+
+        def connect(self, **kwargs):
+            return None
+
+        def get_transport(self):
+            return FakeTransport()
+
+        def invoke_shell(self, term, width, height):
+            return FakeChan()
+
+        def close(self):
+            return None
+
+    shell = InteractiveShell("10.0.0.1", "u", "p", client_factory=FakeClient, sleep_fn=lambda _s: None)
+    shell.connect()
+    shell.close()
+
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in recorded["setsockopt"]
+    assert recorded["keepalive"] == InteractiveShell.KEEPALIVE_INTERVAL_SEC
+
+
 def test_auto_monitor_tick_recovers_offline_and_reads_battery(monkeypatch):
     observed = {"connect_calls": 0, "commands": []}
 
@@ -638,9 +687,13 @@ def test_auto_monitor_topics_mode_runs_topic_snapshot_on_interval(monkeypatch):
         def run_command(self, command, timeout):
             _ = timeout
             observed["commands"].append(command)
+            topics_output = "/buttons\n/diagnostics\n/imu\n/joint_states\n/pose\n/rosout\n/rosout_agg\n/tf\n/tf_static\n/cmd_ser\n/cmd_vel\n/odom\n/odom/wheel\n/set_pose\n/velocity\n/scan\n/range/fl\n/range/fr\n/range/rl\n/range/rr\n/camera/color/camera_info\n/camera/color/image_raw\n/camera/depth/camera_info\n/camera/depth/image_raw\n/camera/depth/points\n/camera/depth_registered/points\n/camera/extrinsic/depth_to_color\n/camera/ir/camera_info\n/camera/ir/image_raw\n/camera/reset_device\n"
+            battery_output = "percentage: 0.82\nvoltage: 12.61\n"
+            if TerminalManager.FUSED_PROBE_MARKER in command:
+                return f"{battery_output}{TerminalManager.FUSED_PROBE_MARKER}\n{topics_output}"
             if "rostopic list" in command:
-                return "/buttons\n/diagnostics\n/imu\n/joint_states\n/pose\n/rosout\n/rosout_agg\n/tf\n/tf_static\n/cmd_ser\n/cmd_vel\n/odom\n/odom/wheel\n/set_pose\n/velocity\n/scan\n/range/fl\n/range/fr\n/range/rl\n/range/rr\n/camera/color/camera_info\n/camera/color/image_raw\n/camera/depth/camera_info\n/camera/depth/image_raw\n/camera/depth/points\n/camera/depth_registered/points\n/camera/extrinsic/depth_to_color\n/camera/ir/camera_info\n/camera/ir/image_raw\n/camera/reset_device\n"
-            return "percentage: 0.82\nvoltage: 12.61\n"
+                return topics_output
+            return battery_output
 
     monkeypatch.setattr(tm_module, "InteractiveShell", FakeShell)
 
@@ -675,10 +728,15 @@ def test_auto_monitor_topics_mode_runs_topic_snapshot_on_interval(monkeypatch):
 
     topic_calls = [command for command in observed["commands"] if "rostopic list" in command]
     assert len(topic_calls) == 1
+    # Battery and topics fall due together on the first tick, so they ride
+    # one fused round-trip instead of two sequential commands.
+    fused_calls = [command for command in observed["commands"] if TerminalManager.FUSED_PROBE_MARKER in command]
+    assert len(fused_calls) == 1
 
     runtime = manager.get_runtime_tests("r1")
     assert runtime["general"]["status"] == "ok"
     assert runtime["general"]["source"] == "auto-monitor-topics"
+    assert runtime["battery"]["value"] == "82%"
 
 
 def test_runtime_updates_ignore_stale_checked_at():
@@ -874,12 +932,19 @@ def test_auto_recovery_tests_hold_testing_state_for_min_visibility(monkeypatch):
         auto_monitor=False,
     )
 
-    sleep_calls: list[float] = []
+    timer_delays: list[float] = []
+
+    class ImmediateTimer:
+        def __init__(self, delay, fn):
+            timer_delays.append(float(delay))
+            self._fn = fn
+            self.daemon = False
+
+        def start(self):
+            self._fn()
+
     monkeypatch.setattr("backend.terminal_manager.test_runner.time.time", lambda: 1000.0)
-    monkeypatch.setattr(
-        "backend.terminal_manager.test_runner.time.sleep",
-        lambda seconds: sleep_calls.append(float(seconds)),
-    )
+    monkeypatch.setattr("backend.terminal_manager.test_runner.threading.Timer", ImmediateTimer)
 
     manager._executor.run_tests = lambda **_kwargs: [
         {
@@ -904,8 +969,8 @@ def test_auto_recovery_tests_hold_testing_state_for_min_visibility(monkeypatch):
     with manager._lock:
         inflight_after = "r1" in manager._auto_recovery_test_inflight
     assert inflight_after is False
-    assert sleep_calls
-    assert sleep_calls[0] >= manager.AUTO_ACTIVITY_MIN_VISIBLE_SEC
+    assert timer_delays
+    assert timer_delays[0] >= manager.AUTO_ACTIVITY_MIN_VISIBLE_SEC
 
     runtime = manager.get_runtime_tests("r1")
     assert runtime["general"]["status"] == "ok"
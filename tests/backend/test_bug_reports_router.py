@@ -53,3 +53,33 @@ def test_create_bug_report_rejects_blank_message(tmp_path: Path) -> None:
 
     assert response.status_code == 400
     assert "cannot be empty" in response.json()["detail"]
+
+
+def test_create_bug_report_concurrent_posts_get_unique_filenames(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    logs_dir = tmp_path / "logs"
+    client = _build_client(logs_dir)
+
+    def _post(index: int) -> str:
+        response = client.post("/api/bug-reports", json={"message": f"Report {index}"})
+        assert response.status_code == 200
+        return response.json()["fileName"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        names = list(pool.map(_post, range(100)))
+
+    assert len(set(names)) == 100
+    assert sum(1 for child in logs_dir.iterdir() if child.is_file()) == 100
+
+
+def test_create_bug_report_seeds_counter_from_existing_reports(tmp_path: Path) -> None:
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir(parents=True)
+    (logs_dir / "bug_4_20240101T000000000000Z").write_text("old", encoding="utf-8")
+    client = _build_client(logs_dir)
+
+    response = client.post("/api/bug-reports", json={"message": "After restart"})
+
+    assert response.status_code == 200
+    assert response.json()["fileName"].startswith("bug_5_")
@@ -67,7 +67,6 @@ def test_composite_runner_executes_once_for_multiple_checks():
             return "/battery\n/camera/color/image_raw\n/camera/depth/image_raw\n"
 
     fake_shell = FakeShell()
-    close_calls: list[tuple[str, str]] = []
     robot_type = {
         "typeId": "rosbot-2-pro",
         "tests": [
@@ -91,9 +90,7 @@ def test_composite_runner_executes_once_for_multiple_checks():
     executor = TestExecutor(
         robot_types_by_id={"rosbot-2-pro": robot_type},
         resolve_robot_type=lambda _robot_id: robot_type,
-        resolve_credentials=lambda _robot_id: ("10.0.0.1", "u", "p", 22),
         get_or_connect=lambda _page_session_id, _robot_id: fake_shell,
-        close_session=lambda page_session_id, robot_id: close_calls.append((page_session_id, robot_id)),
         check_online=lambda _robot_id: {"status": "ok", "value": "reachable", "details": "ok", "ms": 1},
         test_definitions_by_id=_test_definitions(),
         check_definitions_by_id=_check_definitions(),
@@ -113,7 +110,6 @@ def test_composite_runner_executes_once_for_multiple_checks():
     assert by_id["battery"]["status"] == "ok"
     assert by_id["camera"]["status"] == "ok"
     assert by_id["battery"]["raw"]["sharedExecutionId"] == by_id["camera"]["raw"]["sharedExecutionId"]
-    assert close_calls == [("page-1", "r1")]
 
 
 def test_composite_runner_executes_parent_for_single_subcheck_request():
@@ -149,9 +145,7 @@ def test_composite_runner_executes_parent_for_single_subcheck_request():
     executor = TestExecutor(
         robot_types_by_id={"rosbot-2-pro": robot_type},
         resolve_robot_type=lambda _robot_id: robot_type,
-        resolve_credentials=lambda _robot_id: ("10.0.0.1", "u", "p", 22),
         get_or_connect=lambda _page_session_id, _robot_id: fake_shell,
-        close_session=lambda _page_session_id, _robot_id: None,
         check_online=lambda _robot_id: {"status": "ok", "value": "reachable", "details": "ok", "ms": 1},
         test_definitions_by_id=_test_definitions(),
         check_definitions_by_id=_check_definitions(),
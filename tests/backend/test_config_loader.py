@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
-
 import pytest
 
+from _jsonutil import dumps
+
 from backend.config_loader import (
     RobotCatalog,
     load_robot_types_config,
@@ -20,14 +20,14 @@ def test_load_robots_config_missing_file_returns_empty_list(tmp_path):
 
 def test_load_robots_config_accepts_array_shape(tmp_path):
     path = tmp_path / "robots.json"
-    path.write_text(json.dumps([{"id": "r1", "name": "R1"}]), encoding="utf-8")
+    path.write_text(dumps([{"id": "r1", "name": "R1"}]), encoding="utf-8")
     payload = load_robots_config(path)
     assert payload == [{"id": "r1", "name": "R1"}]
 
 
 def test_load_robot_types_config_ignores_invalid_shape(tmp_path):
     path = tmp_path / "robot-types.json"
-    path.write_text(json.dumps({"version": "1.0", "items": []}), encoding="utf-8")
+    path.write_text(dumps({"version": "1.0", "items": []}), encoding="utf-8")
     assert load_robot_types_config(path) == []
 
 
@@ -40,11 +40,11 @@ def test_load_definition_catalog_supports_directory_shape(tmp_path):
     fixes_dir.mkdir()
 
     (commands_dir / "rostopic.command.json").write_text(
-        json.dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
+        dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
         encoding="utf-8",
     )
     (tests_dir / "topics.test.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "topics_snapshot",
                 "execute": [{"id": "topics", "command": "$rostopic_list$", "saveAs": "topics_raw"}],
@@ -67,7 +67,7 @@ def test_load_definition_catalog_supports_directory_shape(tmp_path):
         encoding="utf-8",
     )
     (fixes_dir / "flash.fix.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "flash_fix",
                 "execute": [{"id": "down", "command": "echo down"}],
@@ -189,11 +189,11 @@ def test_robot_catalog_load_from_paths_builds_indexes(tmp_path):
     fixes_dir.mkdir()
 
     robots_path.write_text(
-        json.dumps({"robots": [{"id": "r1", "name": "A", "type": "rosbot-2-pro"}]}),
+        dumps({"robots": [{"id": "r1", "name": "A", "type": "rosbot-2-pro"}]}),
         encoding="utf-8",
     )
     types_path.write_text(
-        json.dumps(
+        dumps(
             {
                 "robotTypes": [
                     {
@@ -209,11 +209,11 @@ def test_robot_catalog_load_from_paths_builds_indexes(tmp_path):
     )
 
     (commands_dir / "noop.command.json").write_text(
-        json.dumps({"id": "noop", "command": "echo noop"}),
+        dumps({"id": "noop", "command": "echo noop"}),
         encoding="utf-8",
     )
     (tests_dir / "online.test.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "online_probe",
                 "mode": "online_probe",
@@ -234,7 +234,7 @@ def test_robot_catalog_load_from_paths_builds_indexes(tmp_path):
         encoding="utf-8",
     )
     (fixes_dir / "flash.fix.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "flash_fix",
                 "label": "Flash fix",
@@ -268,7 +268,7 @@ def test_robot_catalog_load_from_paths_normalizes_legacy_model_url(tmp_path):
     fixes_dir.mkdir()
 
     robots_path.write_text(
-        json.dumps(
+        dumps(
             {
                 "version": "1.0",
                 "robots": [
@@ -284,7 +284,7 @@ def test_robot_catalog_load_from_paths_normalizes_legacy_model_url(tmp_path):
         encoding="utf-8",
     )
     types_path.write_text(
-        json.dumps({"version": "3.0", "robotTypes": [{"id": "rosbot-2-pro", "name": "Rosbot", "testRefs": [], "fixRefs": []}]}),
+        dumps({"version": "3.0", "robotTypes": [{"id": "rosbot-2-pro", "name": "Rosbot", "testRefs": [], "fixRefs": []}]}),
         encoding="utf-8",
     )
 
@@ -311,11 +311,11 @@ def test_load_definition_catalog_rejects_all_of_with_invalid_nested_kind(tmp_pat
     fixes_dir.mkdir()
 
     (commands_dir / "rostopic.command.json").write_text(
-        json.dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
+        dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
         encoding="utf-8",
     )
     (tests_dir / "bad.test.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "bad",
                 "execute": [{"id": "topics", "command": "$rostopic_list$", "saveAs": "topics_raw"}],
@@ -339,7 +339,7 @@ def test_load_definition_catalog_rejects_all_of_with_invalid_nested_kind(tmp_pat
         encoding="utf-8",
     )
     (fixes_dir / "flash.fix.json").write_text(
-        json.dumps({"id": "flash_fix", "execute": [{"id": "noop", "command": "echo fix"}]}),
+        dumps({"id": "flash_fix", "execute": [{"id": "noop", "command": "echo fix"}]}),
         encoding="utf-8",
     )
 
@@ -360,11 +360,11 @@ def test_load_definition_catalog_rejects_mixed_run_at_connection_values(tmp_path
     fixes_dir.mkdir()
 
     (commands_dir / "rostopic.command.json").write_text(
-        json.dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
+        dumps({"id": "rostopic_list", "command": "timeout 12s rostopic list"}),
         encoding="utf-8",
     )
     (tests_dir / "mixed.test.json").write_text(
-        json.dumps(
+        dumps(
             {
                 "id": "mixed",
                 "execute": [{"id": "topics", "command": "$rostopic_list$", "saveAs": "topics_raw"}],
@@ -389,7 +389,7 @@ def test_load_definition_catalog_rejects_mixed_run_at_connection_values(tmp_path
         encoding="utf-8",
     )
     (fixes_dir / "flash.fix.json").write_text(
-        json.dumps({"id": "flash_fix", "execute": [{"id": "noop", "command": "echo fix"}]}),
+        dumps({"id": "flash_fix", "execute": [{"id": "noop", "command": "echo fix"}]}),
         encoding="utf-8",
     )
 
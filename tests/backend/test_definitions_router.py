@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+from _jsonutil import dumps, loads
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -15,7 +15,7 @@ from backend.terminal_manager import TerminalManager
 
 def _write_json(path: Path, payload: object) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    path.write_text(dumps(payload, indent=True) + "\n", encoding="utf-8")
 
 
 def _build_client(tmp_path: Path) -> tuple[TestClient, Path]:
@@ -227,7 +227,7 @@ def test_create_fix_definition_persists_run_at_connection(tmp_path: Path):
     assert payload["ok"] is True
     assert payload["id"] == "quick_fix"
 
-    saved = json.loads((tmp_path / "fixes" / "quick_fix.fix.json").read_text(encoding="utf-8"))
+    saved = loads((tmp_path / "fixes" / "quick_fix.fix.json").read_bytes())
     assert saved["runAtConnection"] is True
 
     summary = client.get("/api/definitions/summary")
@@ -283,7 +283,7 @@ def test_create_test_definition_accepts_all_of_read_kind(tmp_path: Path):
     )
 
     assert response.status_code == 200
-    saved = json.loads((tmp_path / "tests" / "topics_multi_output.test.json").read_text(encoding="utf-8"))
+    saved = loads((tmp_path / "tests" / "topics_multi_output.test.json").read_bytes())
     assert saved["checks"][0]["read"]["kind"] == "all_of"
     assert isinstance(saved["checks"][0]["read"]["rules"], list)
     assert len(saved["checks"][0]["read"]["rules"]) == 2
@@ -403,7 +403,7 @@ def test_patch_robot_type_mapping_updates_only_target_type(tmp_path: Path):
     assert payload["typeId"] == "rosbot-2-pro"
     assert payload["testRefs"] == ["online", "battery", "camera"]
 
-    robot_types_payload = json.loads(robot_types_path.read_text(encoding="utf-8"))
+    robot_types_payload = loads(robot_types_path.read_bytes())
     type_rows = robot_types_payload.get("robotTypes", [])
     target = next(item for item in type_rows if item.get("id") == "rosbot-2-pro")
     untouched = next(item for item in type_rows if item.get("id") == "rosbot-lite")
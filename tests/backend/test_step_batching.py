@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from backend.connectors import OrchestrateConnector, ReadConnector, WriteConnector
+
+
+def _pty_output(command: str, body: str) -> str:
+    return f"{command}\r\n{body}user@robot:~$ "
+
+
+def _definition(execute: list[dict], checks: list[dict]) -> dict:
+    return {"id": "batched", "mode": "orchestrate", "execute": execute, "checks": checks}
+
+
+def _check(check_id: str, input_ref: str, needle: str) -> dict:
+    return {
+        "id": check_id,
+        "read": {"kind": "contains_string", "inputRef": input_ref, "needle": needle},
+        "pass": {"status": "ok", "value": "ok", "details": "ok"},
+        "fail": {"status": "error", "value": "missing", "details": "missing"},
+    }
+
+
+def test_multi_step_definition_runs_in_one_shell_invocation():
+    sent: list[str] = []
+
+    def run_command(command: str, timeout: float | None) -> str:
+        sent.append(command)
+        return _pty_output(
+            command,
+            "__BATCH_BEGIN__\r\n"
+            "out-one\r\n"
+            "__BATCH_STEP__0\r\n"
+            "out-two\r\n"
+            "__BATCH_STEP__1\r\n",
+        )
+
+    connector = OrchestrateConnector(read=ReadConnector(), write=WriteConnector({}))
+    cache: dict[str, str] = {}
+    result = connector.run_definition(
+        _definition(
+            execute=[
+                {"id": "s1", "command": "echo one", "saveAs": "a", "reuseKey": "k1"},
+                {"id": "s2", "command": "echo two", "saveAs": "b"},
+            ],
+            checks=[_check("c1", "a", "out-one"), _check("c2", "b", "out-two")],
+        ),
+        run_scope="rs",
+        run_command=run_command,
+        command_cache=cache,
+    )
+
+    assert len(sent) == 1
+    assert "echo one" in sent[0] and "echo two" in sent[0]
+    assert result["checkResults"]["c1"]["status"] == "ok"
+    assert result["checkResults"]["c2"]["status"] == "ok"
+    assert "out-one" in result["vars"]["a"]
+    assert "out-two" not in result["vars"]["a"]
+    assert cache["rs:k1"].strip() == "out-one"
+    assert [step["id"] for step in result["steps"]] == ["s1", "s2"]
+
+
+def test_var_referencing_step_falls_back_to_per_step_execution():
+    sent: list[str] = []
+
+    def run_command(command: str, timeout: float | None) -> str:
+        sent.append(command)
+        return _pty_output(command, "probe-output\r\n")
+
+    connector = OrchestrateConnector(read=ReadConnector(), write=WriteConnector({}))
+    result = connector.run_definition(
+        _definition(
+            execute=[
+                {"id": "s1", "command": "echo one", "saveAs": "a"},
+                {"id": "s2", "command": {"ref": "a"}, "saveAs": "b"},
+            ],
+            checks=[_check("c1", "b", "probe-output")],
+        ),
+        run_scope="rs",
+        run_command=run_command,
+        command_cache={},
+    )
+
+    assert len(sent) == 2
+    assert result["checkResults"]["c1"]["status"] == "ok"
+
+
+def test_cached_reuse_key_keeps_per_step_path_and_skips_execution():
+    sent: list[str] = []
+
+    def run_command(command: str, timeout: float | None) -> str:
+        sent.append(command)
+        return _pty_output(command, "fresh-output\r\n")
+
+    connector = OrchestrateConnector(read=ReadConnector(), write=WriteConnector({}))
+    cache = {"rs:k1": "cached-output"}
+    result = connector.run_definition(
+        _definition(
+            execute=[
+                {"id": "s1", "command": "echo one", "reuseKey": "k1", "saveAs": "a"},
+                {"id": "s2", "command": "echo two", "saveAs": "b"},
+            ],
+            checks=[_check("c1", "a", "cached-output"), _check("c2", "b", "fresh-output")],
+        ),
+        run_scope="rs",
+        run_command=run_command,
+        command_cache=cache,
+    )
+
+    assert sent == ["echo two"]
+    assert result["checkResults"]["c1"]["status"] == "ok"
+    assert result["checkResults"]["c2"]["status"] == "ok"
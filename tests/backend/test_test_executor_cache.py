@@ -16,7 +16,6 @@ def test_run_tests_reuses_rostopic_list_output_across_checks_in_same_definition(
             return ""
 
     fake_shell = FakeShell()
-    close_calls: list[tuple[str, str]] = []
     robot_type = {
         "typeId": "rosbot-2-pro",
         "tests": [
@@ -79,9 +78,7 @@ def test_run_tests_reuses_rostopic_list_output_across_checks_in_same_definition(
     executor = TestExecutor(
         robot_types_by_id={"rosbot-2-pro": robot_type},
         resolve_robot_type=lambda _robot_id: robot_type,
-        resolve_credentials=lambda _robot_id: ("10.0.0.1", "u", "p", 22),
         get_or_connect=lambda _page_session_id, _robot_id: fake_shell,
-        close_session=lambda page_session_id, robot_id: close_calls.append((page_session_id, robot_id)),
         check_online=lambda _robot_id: {"status": "ok", "value": "reachable", "details": "ok", "ms": 1},
         test_definitions_by_id=definitions,
         check_definitions_by_id={
@@ -101,4 +98,3 @@ def test_run_tests_reuses_rostopic_list_output_across_checks_in_same_definition(
     assert len(rostopic_calls) == 1
     assert len(results) == 2
     assert all(result["status"] == "ok" for result in results)
-    assert close_calls == [("page-1", "r1")]
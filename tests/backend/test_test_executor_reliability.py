@@ -28,9 +28,7 @@ def _executor_for_tests(robot_type: dict[str, object], shell: _FakeShell, *, def
     return TestExecutor(
         robot_types_by_id={"rosbot-2-pro": robot_type},
         resolve_robot_type=lambda _robot_id: robot_type,
-        resolve_credentials=lambda _robot_id: ("10.0.0.1", "u", "p", 22),
         get_or_connect=lambda _page_session_id, _robot_id: shell,
-        close_session=lambda _page_session_id, _robot_id: None,
         check_online=lambda _robot_id: {"status": "ok", "value": "reachable", "details": "ok", "ms": 1},
         test_definitions_by_id=definitions,
         check_definitions_by_id=check_defs,